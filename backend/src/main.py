@@ -8,8 +8,8 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from module.api import v1
 from module.conf import VERSION, settings, setup_logger
+from module.utils import poster_file
 
-setup_logger(reset=True)
 logger = logging.getLogger(__name__)
 uvicorn_logging_config = {
     "version": 1,
@@ -37,10 +37,13 @@ def create_app() -> FastAPI:
 
 app = create_app()
 
+POSTER_HEADERS = {"Cache-Control": "public, max-age=31536000, immutable"}
+
 
 @app.get("/posters/{path:path}", tags=["posters"])
-def posters(path: str):
-    return FileResponse(f"data/posters/{path}")
+def posters(path: str, w: int | None = None):
+    # Poster names are content hashes, so a URL never changes its image
+    return FileResponse(poster_file(path, w), headers=POSTER_HEADERS)
 
 
 if VERSION != "DEV_VERSION":
@@ -64,6 +67,9 @@ else:
 
 
 if __name__ == "__main__":
+    # Parser processes re-run this file as __mp_main__, only the server may
+    # reset the log
+    setup_logger(reset=True)
     if os.getenv("IPV6"):
         host = "::"
     else:
@@ -1,6 +1,7 @@
 import logging
 import threading
-import time
+
+from module.utils import RetryPolicy, host_breaker
 
 from .timeout import timeout
 
@@ -10,16 +11,20 @@ lock = threading.Lock()
 
 def qb_connect_failed_wait(func):
     def wrapper(*args, **kwargs):
-        times = 0
-        while times < 5:
+        host = getattr(args[0], "host", "qbittorrent")
+        for _ in RetryPolicy(attempts=5, base_delay=5, max_delay=60, deadline=120):
+            if not host_breaker.allow(host):
+                logger.warning("qBittorrent is unreachable, skip this call.")
+                return None
             try:
-                return func(*args, **kwargs)
+                result = func(*args, **kwargs)
+                host_breaker.success(host)
+                return result
             except Exception as e:
+                host_breaker.failure(host)
                 logger.debug(f"URL: {args[0]}")
                 logger.warning(e)
-                logger.warning("Cannot connect to qBittorrent. Wait 5 min and retry...")
-                time.sleep(300)
-                times += 1
+                logger.warning("Cannot connect to qBittorrent. Retrying...")
 
     return wrapper
 
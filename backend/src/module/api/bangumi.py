@@ -40,7 +40,7 @@ async def get_data(bangumi_id: str):
     response_model=APIResponse,
     dependencies=[Depends(get_current_user)],
 )
-async def update_rule(
+def update_rule(
     bangumi_id: int,
     data: BangumiUpdate,
 ):
@@ -54,7 +54,7 @@ async def update_rule(
     response_model=APIResponse,
     dependencies=[Depends(get_current_user)],
 )
-async def delete_rule(bangumi_id: str, file: bool = False):
+def delete_rule(bangumi_id: str, file: bool = False):
     with TorrentManager() as manager:
         resp = manager.delete_rule(bangumi_id, file)
     return u_response(resp)
@@ -65,7 +65,7 @@ async def delete_rule(bangumi_id: str, file: bool = False):
     response_model=APIResponse,
     dependencies=[Depends(get_current_user)],
 )
-async def delete_many_rule(bangumi_id: list, file: bool = False):
+def delete_many_rule(bangumi_id: list, file: bool = False):
     with TorrentManager() as manager:
         for i in bangumi_id:
             resp = manager.delete_rule(i, file)
@@ -77,7 +77,7 @@ async def delete_many_rule(bangumi_id: list, file: bool = False):
     response_model=APIResponse,
     dependencies=[Depends(get_current_user)],
 )
-async def disable_rule(bangumi_id: str, file: bool = False):
+def disable_rule(bangumi_id: str, file: bool = False):
     with TorrentManager() as manager:
         resp = manager.disable_rule(bangumi_id, file)
     return u_response(resp)
@@ -88,7 +88,7 @@ async def disable_rule(bangumi_id: str, file: bool = False):
     response_model=APIResponse,
     dependencies=[Depends(get_current_user)],
 )
-async def disable_many_rule(bangumi_id: list, file: bool = False):
+def disable_many_rule(bangumi_id: list, file: bool = False):
     with TorrentManager() as manager:
         for i in bangumi_id:
             resp = manager.disable_rule(i, file)
@@ -100,7 +100,7 @@ async def disable_many_rule(bangumi_id: list, file: bool = False):
     response_model=APIResponse,
     dependencies=[Depends(get_current_user)],
 )
-async def enable_rule(bangumi_id: str):
+def enable_rule(bangumi_id: str):
     with TorrentManager() as manager:
         resp = manager.enable_rule(bangumi_id)
     return u_response(resp)
@@ -111,7 +111,7 @@ async def enable_rule(bangumi_id: str):
     response_model=APIResponse,
     dependencies=[Depends(get_current_user)],
 )
-async def refresh_poster():
+def refresh_poster():
     with TorrentManager() as manager:
         resp = manager.refresh_poster()
     return u_response(resp)
@@ -121,7 +121,7 @@ async def refresh_poster():
     response_model=APIResponse,
     dependencies=[Depends(get_current_user)],
 )
-async def refresh_poster(bangumi_id: int):
+def refresh_poster(bangumi_id: int):
     with TorrentManager() as manager:
         resp = manager.refind_poster(bangumi_id)
     return u_response(resp)
@@ -1,18 +1,21 @@
+import hmac
 import logging
 import os
+import re
 import signal
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Cookie, Depends, HTTPException
 from fastapi.responses import JSONResponse
 
-from module.conf import VERSION
+from module.conf import VERSION, settings
 from module.core import Program
-from module.models import APIResponse
+from module.models import APIResponse, ResponseModel
 from module.security.api import UNAUTHORIZED, get_current_user
 
 from .response import u_response
 
 logger = logging.getLogger(__name__)
+HASH_RE = re.compile(r"^[0-9a-fA-F]{40}$")
 program = Program()
 router = APIRouter(tags=["program"])
 
@@ -72,6 +75,58 @@ async def stop():
     return u_response(program.stop())
 
 
+async def get_rename_user(key: str | None = None, token: str = Cookie(None)):
+    # qBittorrent has no login cookie, it sends the configured rename_token
+    secret = settings.program.rename_token
+    if key and secret and hmac.compare_digest(key, secret):
+        return "webhook"
+    return await get_current_user(token)
+
+
+@router.post(
+    "/rename/{torrent_hash}",
+    response_model=APIResponse,
+    dependencies=[Depends(get_rename_user)],
+)
+async def rename_torrent(torrent_hash: str):
+    # Called by qBittorrent's "run external program on torrent finished"
+    if not HASH_RE.match(torrent_hash):
+        return u_response(
+            ResponseModel(
+                status=False,
+                status_code=400,
+                msg_en="Invalid torrent hash.",
+                msg_zh="无效的种子哈希。",
+            )
+        )
+    if not program.is_running:
+        return u_response(
+            ResponseModel(
+                status=False,
+                status_code=406,
+                msg_en="Program is not running.",
+                msg_zh="程序未运行。",
+            )
+        )
+    if not program.queue_rename(torrent_hash.lower()):
+        return u_response(
+            ResponseModel(
+                status=False,
+                status_code=503,
+                msg_en="Rename queue is full.",
+                msg_zh="重命名队列已满。",
+            )
+        )
+    return u_response(
+        ResponseModel(
+            status=True,
+            status_code=200,
+            msg_en="Rename scheduled.",
+            msg_zh="已加入重命名队列。",
+        )
+    )
+
+
 @router.get("/status", response_model=dict, dependencies=[Depends(get_current_user)])
 async def program_status():
     if not program.is_running:
@@ -111,5 +166,5 @@ async def shutdown_program():
     response_model=bool,
     dependencies=[Depends(get_current_user)],
 )
-async def check_downloader_status():
+def check_downloader_status():
     return program.check_downloader()
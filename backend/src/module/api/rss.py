@@ -4,6 +4,7 @@ from fastapi.responses import JSONResponse
 from module.downloader import DownloadClient
 from module.manager import SeasonCollector
 from module.models import APIResponse, Bangumi, RSSItem, RSSUpdate, Torrent
+from module.network import AsyncRequestContent
 from module.rss import RSSAnalyser, RSSEngine
 from module.security.api import UNAUTHORIZED, get_current_user
 
@@ -24,6 +25,9 @@ async def get_rss():
     path="/add", response_model=APIResponse, dependencies=[Depends(get_current_user)]
 )
 async def add_rss(rss: RSSItem):
+    if not rss.name:
+        async with AsyncRequestContent() as req:
+            rss.name = await req.get_rss_title(rss.url) or ""
     with RSSEngine() as engine:
         result = engine.add_rss(rss.url, rss.name, rss.aggregate, rss.parser)
     return u_response(result)
@@ -132,7 +136,7 @@ async def update_rss(
     response_model=APIResponse,
     dependencies=[Depends(get_current_user)],
 )
-async def refresh_all():
+def refresh_all():
     with RSSEngine() as engine, DownloadClient() as client:
         engine.refresh_rss(client)
         return JSONResponse(
@@ -146,7 +150,7 @@ async def refresh_all():
     response_model=APIResponse,
     dependencies=[Depends(get_current_user)],
 )
-async def refresh_rss(rss_id: int):
+def refresh_rss(rss_id: int):
     with RSSEngine() as engine, DownloadClient() as client:
         engine.refresh_rss(client, rss_id)
         return JSONResponse(
@@ -174,7 +178,7 @@ analyser = RSSAnalyser()
 @router.post(
     "/analysis", response_model=Bangumi, dependencies=[Depends(get_current_user)]
 )
-async def analysis(rss: RSSItem):
+def analysis(rss: RSSItem):
     data = analyser.link_to_data(rss)
     if isinstance(data, Bangumi):
         return data
@@ -185,7 +189,7 @@ async def analysis(rss: RSSItem):
 @router.post(
     "/collect", response_model=APIResponse, dependencies=[Depends(get_current_user)]
 )
-async def download_collection(data: Bangumi):
+def download_collection(data: Bangumi):
     with SeasonCollector() as collector:
         resp = collector.collect_season(data, data.rss_link)
         return u_response(resp)
@@ -194,7 +198,7 @@ async def download_collection(data: Bangumi):
 @router.post(
     "/subscribe", response_model=APIResponse, dependencies=[Depends(get_current_user)]
 )
-async def subscribe(data: Bangumi, rss: RSSItem):
+def subscribe(data: Bangumi, rss: RSSItem):
     with SeasonCollector() as collector:
         resp = collector.subscribe_season(data, parser=rss.parser)
         return u_response(resp)
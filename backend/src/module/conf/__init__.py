@@ -9,5 +9,6 @@ DATA_PATH = "sqlite:///data/data.db"
 LEGACY_DATA_PATH = Path("data/data.json")
 VERSION_PATH = Path("config/version.info")
 POSTERS_PATH = Path("data/posters")
+TORRENTS_PATH = Path("data/torrents")
 
 PLATFORM = "Windows" if "\\" in settings.downloader.path else "Unix"
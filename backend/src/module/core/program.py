@@ -3,6 +3,7 @@ import asyncio
 
 from module.conf import VERSION, settings
 from module.models import ResponseModel
+from module.parser.pool import shutdown_pool
 from module.update import (
     data_migration,
     first_run,
@@ -53,6 +54,8 @@ class Program(RenameThread, RSSThread):
             # Update database
             from_30_to_31()
             logger.info("[Core] Database updated.")
+        # Create tables added since the database was built
+        start_up()
         if not self.img_cache:
             logger.info("[Core] No image cache exists, create image cache.")
             cache_image()
@@ -82,6 +85,7 @@ class Program(RenameThread, RSSThread):
             self.stop_event.set()
             self.rename_stop()
             self.rss_stop()
+            shutdown_pool()
             return ResponseModel(
                 status=True,
                 status_code=200,
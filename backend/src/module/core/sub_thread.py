@@ -1,14 +1,23 @@
+import logging
+import queue
 import threading
 import time
 
 from module.conf import settings
 from module.downloader import DownloadClient
-from module.manager import Renamer, eps_complete
-from module.notification import PostNotification
+from module.manager import CompletionWatcher, Renamer, eps_complete
+from module.notification import NotificationDispatcher
 from module.rss import RSSAnalyser, RSSEngine
 
 from .status import ProgramStatus
 
+logger = logging.getLogger(__name__)
+
+WATCH_INTERVAL = 5
+WATCH_RETRY_TIME = 60
+WATCH_SCAN_TIME = 600
+RENAME_QUEUE_SIZE = 1000
+
 
 class RSSThread(ProgramStatus):
     def __init__(self):
@@ -50,27 +59,93 @@ class RSSThread(ProgramStatus):
 class RenameThread(ProgramStatus):
     def __init__(self):
         super().__init__()
+        self.rename_queue = queue.Queue(maxsize=RENAME_QUEUE_SIZE)
+        self._queued: set[str] = set()
+        self._queued_lock = threading.Lock()
+        self.notification = NotificationDispatcher()
         self._rename_thread = threading.Thread(
             target=self.rename_loop,
         )
+        self._watch_thread = threading.Thread(
+            target=self.watch_loop,
+        )
+
+    @property
+    def scan_interval(self):
+        # Completions arrive as events, the full scan only catches what they miss
+        if settings.program.rename_watch:
+            return max(settings.program.rename_time, WATCH_SCAN_TIME)
+        return settings.program.rename_time
 
     def rename_loop(self):
+        scan_at = 0.0
         while not self.stop_event.is_set():
+            hashes = self._wait_for_hashes(scan_at)
+            if self.stop_event.is_set():
+                break
+            if hashes is None:
+                scan_at = time.monotonic() + self.scan_interval
             with Renamer() as renamer:
-                renamed_info = renamer.rename()
+                renamed_info = renamer.rename(hashes)
             if settings.notification.enable:
-                with PostNotification() as notifier:
-                    for info in renamed_info:
-                        notifier.send_msg(info)
-                        time.sleep(2)
-            self.stop_event.wait(settings.program.rename_time)
+                self.notification.put(renamed_info)
+
+    def _wait_for_hashes(self, scan_at: float) -> list[str] | None:
+        # Returns the completed hashes, or None once the full scan is due
+        while not self.stop_event.is_set():
+            remaining = scan_at - time.monotonic()
+            if remaining <= 0:
+                return None
+            try:
+                hashes = {self.rename_queue.get(timeout=min(remaining, 1))}
+            except queue.Empty:
+                continue
+            while not self.rename_queue.empty():
+                hashes.add(self.rename_queue.get_nowait())
+            with self._queued_lock:
+                self._queued -= hashes
+            return list(hashes)
+        return []
+
+    def queue_rename(self, torrent_hash: str) -> bool:
+        # Hashes already waiting are dropped, False when the queue is full
+        with self._queued_lock:
+            if torrent_hash in self._queued:
+                return True
+            try:
+                self.rename_queue.put_nowait(torrent_hash)
+            except queue.Full:
+                logger.warning("[Renamer] Rename queue is full.")
+                return False
+            self._queued.add(torrent_hash)
+        return True
+
+    def watch_loop(self):
+        while not self.stop_event.is_set():
+            try:
+                with DownloadClient() as client:
+                    watcher = CompletionWatcher(client)
+                    while not self.stop_event.wait(WATCH_INTERVAL):
+                        for _hash in watcher.poll():
+                            self.queue_rename(_hash)
+            except Exception as e:
+                logger.debug(e)
+                logger.warning("[Renamer] Completion watcher lost the downloader.")
+                self.stop_event.wait(WATCH_RETRY_TIME)
 
     def rename_start(self):
+        if settings.notification.enable:
+            self.notification.start()
         self.rename_thread.start()
+        if settings.program.rename_watch:
+            self.watch_thread.start()
 
     def rename_stop(self):
         if self._rename_thread.is_alive():
             self._rename_thread.join()
+        if self._watch_thread.is_alive():
+            self._watch_thread.join()
+        self.notification.stop()
 
     @property
     def rename_thread(self):
@@ -79,3 +154,11 @@ class RenameThread(ProgramStatus):
                 target=self.rename_loop,
             )
         return self._rename_thread
+
+    @property
+    def watch_thread(self):
+        if not self._watch_thread.is_alive():
+            self._watch_thread = threading.Thread(
+                target=self.watch_loop,
+            )
+        return self._watch_thread
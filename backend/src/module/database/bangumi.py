@@ -1,17 +1,163 @@
 import logging
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
 from typing import Optional
 
+from sqlalchemy import insert, update
 from sqlalchemy.sql import func
-from sqlmodel import Session, and_, delete, false, or_, select
+from sqlmodel import Session, and_, col, delete, false, or_, select
 
-from module.models import Bangumi, BangumiUpdate
+from module.models import Bangumi, BangumiRSS, BangumiUpdate
+from module.utils import TitleMatcher
 
 logger = logging.getLogger(__name__)
 
+# Compiled title_raw matcher per engine, rebuilt lazily after bangumi writes.
+_matchers: dict = {}
+_matchers_lock = threading.Lock()
+
 
 class BangumiDatabase:
     def __init__(self, session: Session):
         self.session = session
+        # Pending bulk updates while inside batch(), None otherwise
+        self._updates: dict[tuple, set[int]] | None = None
+        self._rss_appends: dict[str, set[int]] | None = None
+
+    @contextmanager
+    def batch(self):
+        """
+        Collect bangumi writes and commit them in one transaction on exit.
+
+        Updates which set the same values are merged into one
+        ``UPDATE ... WHERE id IN`` statement. Nested calls join the outer batch.
+        """
+        if self._updates is not None:
+            yield self
+            return
+        self._updates = defaultdict(set)
+        self._rss_appends = defaultdict(set)
+        try:
+            yield self
+            self._flush()
+        except BaseException:
+            self.session.rollback()
+            raise
+        finally:
+            self._updates = None
+            self._rss_appends = None
+
+    def _flush(self):
+        count = 0
+        rss_ids = set()
+        for values, ids in self._updates.items():
+            count += self._update_ids(list(ids), dict(values))
+            if "rss_link" in dict(values):
+                rss_ids |= ids
+        if rss_ids:
+            statement = select(Bangumi.id, Bangumi.rss_link).where(
+                col(Bangumi.id).in_(list(rss_ids))
+            )
+            self._sync_rss(self.session.exec(statement).all())
+        for rss_link, ids in self._rss_appends.items():
+            # Skip rows which got the link in the meantime
+            ids = list(ids - self._rss_ids(rss_link))
+            count += self._update_ids(
+                ids,
+                {"rss_link": Bangumi.rss_link + f",{rss_link}", "added": False},
+            )
+            self._insert_rss([(_id, rss_link) for _id in ids])
+        self.session.commit()
+        self._invalidate_matcher()
+        logger.debug(f"[Database] Flush {count} bangumi updates.")
+
+    def _update_ids(self, ids: list[int], values: dict, *where) -> int:
+        # Keep under the SQLite variable limit
+        for i in range(0, len(ids), 500):
+            statement = (
+                update(Bangumi)
+                .where(col(Bangumi.id).in_(ids[i : i + 500]), *where)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            self.session.exec(statement)
+        return len(ids)
+
+    def _defer(self, ids: list[int], **values):
+        # Only inside batch(), callers check self._updates first
+        self._updates[tuple(sorted(values.items()))].update(ids)
+
+    def _sync_rss(self, rows: list[tuple[int, str]]):
+        # Rebuild bangumi_rss rows from the comma-joined rss_link
+        self._delete_rss([_id for _id, _ in rows])
+        self._insert_rss(
+            [
+                (_id, link)
+                for _id, rss_link in rows
+                for link in dict.fromkeys((rss_link or "").split(","))
+                if link
+            ]
+        )
+
+    def _insert_rss(self, pairs: list[tuple[int, str]]):
+        for i in range(0, len(pairs), 250):
+            values = [
+                {"bangumi_id": _id, "rss_link": link}
+                for _id, link in pairs[i : i + 250]
+            ]
+            self.session.exec(
+                insert(BangumiRSS).prefix_with("OR IGNORE").values(values)
+            )
+
+    def _delete_rss(self, ids: list[int]):
+        for i in range(0, len(ids), 500):
+            statement = delete(BangumiRSS).where(
+                col(BangumiRSS.bangumi_id).in_(ids[i : i + 500])
+            )
+            self.session.exec(statement)
+
+    def _rss_ids(self, rss_link: str) -> set[int]:
+        # Exact lookup, a substring test would take ...id=1 as part of ...id=12
+        statement = select(BangumiRSS.bangumi_id).where(BangumiRSS.rss_link == rss_link)
+        return set(self.session.exec(statement).all())
+
+    def rebuild_rss(self):
+        # Also migrates databases which only have the comma-joined column
+        rows = self.session.exec(select(Bangumi.id, Bangumi.rss_link)).all()
+        self._sync_rss(rows)
+        self.session.commit()
+        logger.debug(f"[Database] Rebuild rss links of {len(rows)} bangumi.")
+
+    def _title_ids(self, title_raw: str) -> list[int]:
+        statement = select(Bangumi.id).where(Bangumi.title_raw == title_raw)
+        return self.session.exec(statement).all()
+
+    def _get_matcher(self) -> tuple[TitleMatcher, dict[str, list[tuple[int, bool]]]]:
+        bind = self.session.get_bind()
+        with _matchers_lock:
+            if bind not in _matchers:
+                statement = select(Bangumi.id, Bangumi.title_raw, Bangumi.deleted)
+                rules = defaultdict(list)
+                for _id, title_raw, deleted in self.session.exec(statement).all():
+                    if title_raw is not None:
+                        rules[title_raw].append((_id, deleted))
+                _matchers[bind] = (TitleMatcher(rules.keys()), rules)
+                logger.debug(f"[Database] Build title matcher with {len(rules)} rules.")
+            return _matchers[bind]
+
+    def _invalidate_matcher(self):
+        with _matchers_lock:
+            _matchers.pop(self.session.get_bind(), None)
+
+    def _match_ids(self, torrent_name: str, with_deleted: bool = False) -> list[int]:
+        matcher, rules = self._get_matcher()
+        return sorted(
+            _id
+            for title_raw in matcher.search(torrent_name)
+            for _id, deleted in rules[title_raw]
+            if with_deleted or not deleted
+        )
 
     def add(self, data: Bangumi):
         statement = select(Bangumi).where(Bangumi.title_raw == data.title_raw)
@@ -19,13 +165,19 @@ class BangumiDatabase:
         if bangumi:
             return False
         self.session.add(data)
+        self.session.flush()
+        self._sync_rss([(data.id, data.rss_link)])
         self.session.commit()
+        self._invalidate_matcher()
         logger.debug(f"[Database] Insert {data.official_title} into database.")
         return True
 
     def add_all(self, datas: list[Bangumi]):
         self.session.add_all(datas)
+        self.session.flush()
+        self._sync_rss([(data.id, data.rss_link) for data in datas])
         self.session.commit()
+        self._invalidate_matcher()
         logger.debug(f"[Database] Insert {len(datas)} bangumi into database.")
 
     def update(self, data: Bangumi | BangumiUpdate, _id: int = None) -> bool:
@@ -41,28 +193,44 @@ class BangumiDatabase:
         for key, value in bangumi_data.items():
             setattr(db_data, key, value)
         self.session.add(db_data)
+        if "rss_link" in bangumi_data:
+            self._sync_rss([(db_data.id, db_data.rss_link)])
+        if self._updates is not None:
+            # Written with the rest of the batch
+            return True
         self.session.commit()
+        self._invalidate_matcher()
         self.session.refresh(db_data)
         logger.debug(f"[Database] Update {data.official_title}")
         return True
 
     def update_all(self, datas: list[Bangumi]):
         self.session.add_all(datas)
+        self.session.flush()
+        self._sync_rss([(data.id, data.rss_link) for data in datas])
         self.session.commit()
+        self._invalidate_matcher()
         logger.debug(f"[Database] Update {len(datas)} bangumi.")
 
     def update_rss(self, title_raw, rss_set: str):
         # Update rss and added
+        if self._updates is not None:
+            self._defer(self._title_ids(title_raw), rss_link=rss_set, added=False)
+            return
         statement = select(Bangumi).where(Bangumi.title_raw == title_raw)
         bangumi = self.session.exec(statement).first()
         bangumi.rss_link = rss_set
         bangumi.added = False
         self.session.add(bangumi)
+        self._sync_rss([(bangumi.id, rss_set)])
         self.session.commit()
         self.session.refresh(bangumi)
         logger.debug(f"[Database] Update {title_raw} rss_link to {rss_set}.")
 
     def update_poster(self, title_raw, poster_link: str):
+        if self._updates is not None:
+            self._defer(self._title_ids(title_raw), poster_link=poster_link)
+            return
         statement = select(Bangumi).where(Bangumi.title_raw == title_raw)
         bangumi = self.session.exec(statement).first()
         bangumi.poster_link = poster_link
@@ -75,13 +243,17 @@ class BangumiDatabase:
         statement = select(Bangumi).where(Bangumi.id == _id)
         bangumi = self.session.exec(statement).first()
         self.session.delete(bangumi)
+        self._delete_rss([_id])
         self.session.commit()
+        self._invalidate_matcher()
         logger.debug(f"[Database] Delete bangumi id: {_id}.")
 
     def delete_all(self):
+        self.session.exec(delete(BangumiRSS))
         statement = delete(Bangumi)
         self.session.exec(statement)
         self.session.commit()
+        self._invalidate_matcher()
 
     def search_all(self) -> list[Bangumi]:
         statement = select(Bangumi)
@@ -98,47 +270,42 @@ class BangumiDatabase:
             return self.session.exec(statement).first()
 
     def match_poster(self, bangumi_name: str) -> str:
-        # Use like to match
-        statement = select(Bangumi).where(
-            func.instr(bangumi_name, Bangumi.official_title) > 0
-        )
+        # Exact title uses the index, fall back to substring match
+        statement = select(Bangumi).where(Bangumi.official_title == bangumi_name)
         data = self.session.exec(statement).first()
+        if data is None:
+            statement = select(Bangumi).where(
+                func.instr(bangumi_name, Bangumi.official_title) > 0
+            )
+            data = self.session.exec(statement).first()
         if data:
             return data.poster_link
         else:
             return ""
 
     def match_list(self, torrent_list: list, rss_link: str) -> list:
-        match_datas = self.search_all()
-        if not match_datas:
-            return torrent_list
-        # Match title
-        i = 0
-        while i < len(torrent_list):
-            torrent = torrent_list[i]
-            for match_data in match_datas:
-                if match_data.title_raw in torrent.name:
-                    if rss_link not in match_data.rss_link:
-                        match_data.rss_link += f",{rss_link}"
-                        self.update_rss(match_data.title_raw, match_data.rss_link)
-                    # if not match_data.poster_link:
-                    #     self.update_poster(match_data.title_raw, torrent.poster_link)
-                    torrent_list.pop(i)
-                    break
-            else:
-                i += 1
-        return torrent_list
+        # Match title, deleted bangumi also count as matched
+        unmatched = []
+        with self.batch():
+            linked = self._rss_ids(rss_link)
+            for torrent in torrent_list:
+                match_ids = self._match_ids(torrent.name, with_deleted=True)
+                if not match_ids:
+                    unmatched.append(torrent)
+                    continue
+                if match_ids[0] not in linked:
+                    # Appended in SQL when the batch is flushed
+                    self._rss_appends[rss_link].add(match_ids[0])
+                    linked.add(match_ids[0])
+                # if not match_data.poster_link:
+                #     self.update_poster(match_data.title_raw, torrent.poster_link)
+        return unmatched
 
     def match_torrent(self, torrent_name: str) -> Optional[Bangumi]:
-        statement = select(Bangumi).where(
-            and_(
-                func.instr(torrent_name, Bangumi.title_raw) > 0,
-                # use `false()` to avoid E712 checking
-                # see: https://docs.astral.sh/ruff/rules/true-false-comparison/
-                Bangumi.deleted == false(),
-            )
-        )
-        return self.session.exec(statement).first()
+        match_ids = self._match_ids(torrent_name)
+        if match_ids:
+            return self.session.get(Bangumi, match_ids[0])
+        return None
 
     def not_complete(self) -> list[Bangumi]:
         # Find eps_complete = False
@@ -160,14 +327,22 @@ class BangumiDatabase:
         return datas
 
     def disable_rule(self, _id: int):
+        if self._updates is not None:
+            self._defer([_id], deleted=True)
+            return
         statement = select(Bangumi).where(Bangumi.id == _id)
         bangumi = self.session.exec(statement).first()
         bangumi.deleted = True
         self.session.add(bangumi)
         self.session.commit()
+        self._invalidate_matcher()
         self.session.refresh(bangumi)
         logger.debug(f"[Database] Disable rule {bangumi.title_raw}.")
 
     def search_rss(self, rss_link: str) -> list[Bangumi]:
-        statement = select(Bangumi).where(func.instr(rss_link, Bangumi.rss_link) > 0)
+        statement = (
+            select(Bangumi)
+            .join(BangumiRSS, BangumiRSS.bangumi_id == Bangumi.id)
+            .where(BangumiRSS.rss_link == rss_link)
+        )
         return self.session.exec(statement).all()
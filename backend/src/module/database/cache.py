@@ -0,0 +1,40 @@
+import json
+import logging
+import time
+
+from sqlmodel import Session, col, delete, func, select
+
+from module.models import Cache
+
+logger = logging.getLogger(__name__)
+
+
+class CacheDatabase:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get(self, key: str, ttl: float):
+        data = self.session.get(Cache, key)
+        if data is None:
+            return None
+        if time.time() - data.created_at > ttl:
+            logger.debug(f"[Database] Cache {key} expired.")
+            return None
+        return json.loads(data.value)
+
+    def set(self, key: str, value, max_size: int):
+        data = Cache(key=key, value=json.dumps(value), created_at=time.time())
+        self.session.merge(data)
+        self.session.commit()
+        self.evict(max_size)
+
+    def evict(self, max_size: int):
+        count = self.session.exec(select(func.count()).select_from(Cache)).one()
+        if count <= max_size:
+            return
+        oldest = self.session.exec(
+            select(Cache.key).order_by(col(Cache.created_at)).limit(count - max_size)
+        ).all()
+        self.session.exec(delete(Cache).where(col(Cache.key).in_(oldest)))
+        self.session.commit()
+        logger.debug(f"[Database] Evicted {len(oldest)} cache items.")
@@ -3,7 +3,10 @@ from sqlmodel import Session, SQLModel
 from module.models import Bangumi, User
 
 from .bangumi import BangumiDatabase
+from .cache import CacheDatabase
 from .engine import engine as e
+from .notification import NotificationDatabase
+from .rename import RenameDatabase
 from .rss import RSSDatabase
 from .torrent import TorrentDatabase
 from .user import UserDatabase
@@ -17,9 +20,16 @@ class Database(Session):
         self.torrent = TorrentDatabase(self)
         self.bangumi = BangumiDatabase(self)
         self.user = UserDatabase(self)
+        self.cache = CacheDatabase(self)
+        self.rename = RenameDatabase(self)
+        self.notification = NotificationDatabase(self)
 
     def create_table(self):
         SQLModel.metadata.create_all(self.engine)
+        # create_all skips indexes of tables which already exist
+        for table in SQLModel.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
 
     def drop_table(self):
         SQLModel.metadata.drop_all(self.engine)
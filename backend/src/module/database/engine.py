@@ -1,7 +1,44 @@
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
 from sqlmodel import Session, create_engine
 
 from module.conf import DATA_PATH
 
-engine = create_engine(DATA_PATH)
+POOL_SIZE = 5
+MAX_OVERFLOW = 10
+BUSY_TIMEOUT = 5000
+MMAP_SIZE = 64 * 1024 * 1024
+
+
+def create_db_engine(url: str = DATA_PATH):
+    """
+    SQLite engine shared by the RSS thread, the rename thread and the API.
+
+    WAL lets readers run while a writer holds the database, the busy timeout
+    makes a second writer wait instead of failing with "database is locked".
+    """
+    _engine = create_engine(
+        url,
+        # Connections are pooled and handed between threads
+        connect_args={"check_same_thread": False},
+        poolclass=QueuePool,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_pre_ping=True,
+    )
+
+    @event.listens_for(_engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        cursor.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT}")
+        cursor.close()
+
+    return _engine
+
+
+engine = create_db_engine()
 
 db_session = Session(engine)
@@ -0,0 +1,29 @@
+import logging
+
+from sqlmodel import Session, col, delete, select
+
+from module.models import NotificationRetry
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationDatabase:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def search_all(self) -> list[NotificationRetry]:
+        return self.session.exec(select(NotificationRetry)).all()
+
+    def add_all(self, retries: list[NotificationRetry]):
+        for retry in retries:
+            self.session.merge(retry)
+        self.session.commit()
+        logger.debug(f"[Database] Keep {len(retries)} notifications for retry.")
+
+    def delete_ids(self, ids: list[int]):
+        for i in range(0, len(ids), 500):
+            statement = delete(NotificationRetry).where(
+                col(NotificationRetry.id).in_(ids[i : i + 500])
+            )
+            self.session.exec(statement)
+        self.session.commit()
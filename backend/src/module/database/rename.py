@@ -0,0 +1,31 @@
+import logging
+
+from sqlmodel import Session, col, delete, select
+
+from module.models import RenameState
+
+logger = logging.getLogger(__name__)
+
+
+class RenameDatabase:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def search_all(self) -> dict[str, RenameState]:
+        states = self.session.exec(select(RenameState)).all()
+        return {state.hash: state for state in states}
+
+    def add_all(self, states: list[RenameState]):
+        for state in states:
+            self.session.merge(state)
+        self.session.commit()
+        logger.debug(f"[Database] Record {len(states)} renamed torrents.")
+
+    def delete_hashes(self, hashes: list[str]):
+        # Keep under the SQLite variable limit
+        for i in range(0, len(hashes), 500):
+            statement = delete(RenameState).where(
+                col(RenameState.hash).in_(hashes[i : i + 500])
+            )
+            self.session.exec(statement)
+        self.session.commit()
@@ -1,8 +1,8 @@
 import logging
 
-from sqlmodel import Session, and_, delete, select
+from sqlmodel import Session, and_, col, delete, select
 
-from module.models import RSSItem, RSSUpdate
+from module.models import RSSItem, RSSMarker, RSSUpdate, RSSValidator
 
 logger = logging.getLogger(__name__)
 
@@ -94,3 +94,24 @@ class RSSDatabase:
         condition = delete(RSSItem)
         self.session.exec(condition)
         self.session.commit()
+
+    def search_validators(self, urls: list[str]) -> dict[str, RSSValidator]:
+        statement = select(RSSValidator).where(col(RSSValidator.url).in_(urls))
+        # Detached copies, they are updated by the fetch threads.
+        validators = {
+            v.url: RSSValidator(**v.dict()) for v in self.session.exec(statement).all()
+        }
+        return {url: validators.get(url, RSSValidator(url=url)) for url in urls}
+
+    def search_marker(self, url: str) -> str | None:
+        marker = self.session.get(RSSMarker, url)
+        return marker.last_analysed if marker else None
+
+    def update_marker(self, url: str, torrent_url: str):
+        self.session.merge(RSSMarker(url=url, last_analysed=torrent_url))
+        self.session.commit()
+
+    def update_validators(self, validators: list[RSSValidator]):
+        for validator in validators:
+            self.session.merge(validator)
+        self.session.commit()
@@ -1,6 +1,6 @@
 import logging
 
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from module.models import Torrent
 
@@ -47,11 +47,21 @@ class TorrentDatabase:
     def search_rss(self, rss_id: int) -> list[Torrent]:
         return self.session.exec(select(Torrent).where(Torrent.rss_id == rss_id)).all()
 
+    def search_urls(self, urls: list[str]) -> set[str]:
+        old_urls = set()
+        # Keep under the SQLite variable limit
+        for i in range(0, len(urls), 500):
+            statement = select(Torrent.url).where(
+                col(Torrent.url).in_(urls[i : i + 500])
+            )
+            old_urls.update(self.session.exec(statement).all())
+        return old_urls
+
     def check_new(self, torrents_list: list[Torrent]) -> list[Torrent]:
         new_torrents = []
-        old_torrents = self.search_all()
-        old_urls = [t.url for t in old_torrents]
+        old_urls = self.search_urls(list({t.url for t in torrents_list}))
         for torrent in torrents_list:
             if torrent.url not in old_urls:
                 new_torrents.append(torrent)
+                old_urls.add(torrent.url)
         return new_torrents
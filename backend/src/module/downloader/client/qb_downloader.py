@@ -77,11 +77,14 @@ class QbDownloader:
         return self._client.torrents_createCategory(name=category)
 
     @qb_connect_failed_wait
-    def torrents_info(self, status_filter, category, tag=None):
+    def torrents_info(self, status_filter, category, tag=None, hashes=None):
         return self._client.torrents_info(
-            status_filter=status_filter, category=category, tag=tag
+            status_filter=status_filter, category=category, tag=tag, hashes=hashes
         )
 
+    def sync_maindata(self, rid=0):
+        return self._client.sync_maindata(rid=rid)
+
     def add_torrents(self, torrent_urls, torrent_files, save_path, category):
         resp = self._client.torrents_add(
             is_paused=False,
@@ -1,10 +1,13 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from module.conf import settings
 from module.models import Bangumi, Torrent
 from module.network import RequestContent
+from module.utils import info_hash, magnet_hash
 
 from .path import TorrentPath
+from .torrent_cache import torrent_cache
 
 logger = logging.getLogger(__name__)
 
@@ -99,11 +102,16 @@ class DownloadClient(TorrentPath):
             self.set_rule(info)
         logger.debug("[Downloader] Finished.")
 
-    def get_torrent_info(self, category="Bangumi", status_filter="completed", tag=None):
+    def get_torrent_info(
+        self, category="Bangumi", status_filter="completed", tag=None, hashes=None
+    ):
         return self.client.torrents_info(
-            status_filter=status_filter, category=category, tag=tag
+            status_filter=status_filter, category=category, tag=tag, hashes=hashes
         )
 
+    def get_sync_data(self, rid=0):
+        return self.client.sync_maindata(rid=rid)
+
     def rename_torrent_file(self, _hash, old_path, new_path) -> bool:
         logger.info(f"{old_path} >> {new_path}")
         return self.client.torrents_rename_file(
@@ -115,37 +123,101 @@ class DownloadClient(TorrentPath):
         logger.info("[Downloader] Remove torrents.")
 
     def add_torrent(self, torrent: Torrent | list, bangumi: Bangumi) -> bool:
+        torrents = torrent if isinstance(torrent, list) else [torrent]
+        if not torrents:
+            logger.debug(f"[Downloader] No torrent found: {bangumi.official_title}")
+            return False
+        return len(self.add_torrents(torrents, bangumi)) > 0
+
+    def add_torrents(self, torrents: list[Torrent], bangumi: Bangumi) -> list[Torrent]:
+        """
+        Add torrents which are not in qBittorrent yet, in one request.
+
+        Sets ``downloaded`` on every torrent and returns the ones added now,
+        torrents with a known hash are checked one by one after submitting.
+        """
         if not bangumi.save_path:
             bangumi.save_path = self._gen_save_path(bangumi)
-        with RequestContent() as req:
-            if isinstance(torrent, list):
-                if len(torrent) == 0:
-                    logger.debug(f"[Downloader] No torrent found: {bangumi.official_title}")
-                    return False
-                if "magnet" in torrent[0].url:
-                    torrent_url = [t.url for t in torrent]
-                    torrent_file = None
-                else:
-                    torrent_file = [req.get_content(t.url) for t in torrent]
-                    torrent_url = None
+        files = self._fetch_torrents([t.url for t in torrents if "magnet" not in t.url])
+        pending: dict[str, list[Torrent]] = {}
+        # Magnets without a btih, qBittorrent resolves them itself
+        unknown: list[Torrent] = []
+        for torrent in torrents:
+            if "magnet" in torrent.url:
+                _hash = magnet_hash(torrent.url)
             else:
-                if "magnet" in torrent.url:
-                    torrent_url = torrent.url
-                    torrent_file = None
-                else:
-                    torrent_file = req.get_content(torrent.url)
-                    torrent_url = None
-        if self.client.add_torrents(
-            torrent_urls=torrent_url,
-            torrent_files=torrent_file,
+                _hash = info_hash(files[torrent.url])
+                if _hash is None:
+                    # Failed download or not a torrent file, e.g. an error page
+                    logger.warning(f"[Downloader] Cannot fetch torrent: {torrent.name}")
+                    torrent.downloaded = False
+                    continue
+            if _hash:
+                pending.setdefault(_hash, []).append(torrent)
+            else:
+                unknown.append(torrent)
+        existing = self._present_hashes(list(pending))
+        for _hash in existing:
+            for torrent in pending.pop(_hash, []):
+                torrent.downloaded = True
+        # Torrents sharing a hash are submitted once
+        new = [items[0] for items in pending.values()] + unknown
+        if not new:
+            logger.debug(f"[Downloader] Torrent added before: {bangumi.official_title}")
+            return []
+        urls = [t.url for t in new if "magnet" in t.url]
+        contents = [files[t.url] for t in new if "magnet" not in t.url]
+        added = self.client.add_torrents(
+            torrent_urls=urls or None,
+            torrent_files=contents or None,
             save_path=bangumi.save_path,
             category="Bangumi",
-        ):
-            logger.debug(f"[Downloader] Add torrent: {bangumi.official_title}")
-            return True
-        else:
-            logger.debug(f"[Downloader] Torrent added before: {bangumi.official_title}")
-            return False
+        )
+        # qBittorrent answers "Ok." if any torrent was accepted, check each hash
+        present = self._present_hashes(list(pending))
+        result = []
+        for _hash, items in pending.items():
+            for torrent in items:
+                torrent.downloaded = _hash in present
+            if _hash in present:
+                result.append(items[0])
+            else:
+                logger.warning(f"[Downloader] Failed to add: {items[0].name}")
+        # Only the batch result is known for magnets without a btih
+        for torrent in unknown:
+            torrent.downloaded = added
+        if added:
+            result += unknown
+        if not result:
+            logger.warning(f"[Downloader] Failed to add: {bangumi.official_title}")
+            return []
+        logger.debug(
+            f"[Downloader] Add {len(result)} torrents: {bangumi.official_title}, "
+            f"{len(existing)} already in downloader."
+        )
+        return result
+
+    def _present_hashes(self, hashes: list[str]) -> set[str]:
+        if not hashes:
+            return set()
+        torrents_info = self.get_torrent_info(
+            category=None, status_filter=None, hashes="|".join(hashes)
+        )
+        return {info.hash for info in torrents_info or []}
+
+    @staticmethod
+    def _fetch_torrents(urls: list[str]) -> dict[str, bytes | None]:
+        urls = list(dict.fromkeys(urls))
+        files = torrent_cache.get_many(urls)
+        missing = [url for url in urls if url not in files]
+        if not missing:
+            return files
+        # No more threads than connections in the shared session pool
+        workers = settings.rss_parser.host_limit
+        with RequestContent() as req, ThreadPoolExecutor(workers) as pool:
+            fetched = dict(zip(missing, pool.map(req.get_content, missing)))
+        torrent_cache.put_many({url: c for url, c in fetched.items() if c})
+        return {**files, **fetched}
 
     def move_torrent(self, hashes, location):
         self.client.move_torrent(hashes=hashes, new_location=location)
@@ -0,0 +1,103 @@
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+from module.conf import TORRENTS_PATH, settings
+from module.utils import info_hash
+
+logger = logging.getLogger(__name__)
+
+
+class TorrentCache:
+    """
+    On-disk cache of .torrent files.
+
+    Files are stored once per infohash, an index maps every URL to its hash.
+    The least recently used files are removed once the cache exceeds
+    ``downloader.torrent_cache_size``.
+    """
+
+    def __init__(self, path: Path = TORRENTS_PATH):
+        self.path = path
+        self.index_path = path / "index.json"
+        self._index: dict[str, str] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        return settings.downloader.torrent_cache_size * 1024 * 1024
+
+    @property
+    def index(self) -> dict[str, str]:
+        if self._index is None:
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _file(self, _hash: str) -> Path:
+        return self.path / f"{_hash}.torrent"
+
+    def get_many(self, urls: list[str]) -> dict[str, bytes]:
+        if self.max_size <= 0:
+            return {}
+        contents = {}
+        with self._lock:
+            for url in urls:
+                _hash = self.index.get(url)
+                if _hash is None:
+                    continue
+                file = self._file(_hash)
+                try:
+                    contents[url] = file.read_bytes()
+                    # mtime is the last use, for LRU eviction
+                    os.utime(file)
+                except OSError:
+                    del self.index[url]
+        if contents:
+            logger.debug(f"[Downloader] {len(contents)} torrents from cache.")
+        return contents
+
+    def put_many(self, contents: dict[str, bytes]):
+        if self.max_size <= 0 or not contents:
+            return
+        with self._lock:
+            try:
+                self.path.mkdir(parents=True, exist_ok=True)
+                for url, content in contents.items():
+                    _hash = info_hash(content)
+                    if _hash is None:
+                        # Not a torrent file, e.g. an error page
+                        continue
+                    file = self._file(_hash)
+                    if not file.exists():
+                        file.write_bytes(content)
+                    self.index[url] = _hash
+                self._evict()
+                with open(self.index_path, "w", encoding="utf-8") as f:
+                    json.dump(self.index, f)
+            except OSError as e:
+                logger.warning(f"[Downloader] Cannot write torrent cache: {e}")
+
+    def _evict(self):
+        files = sorted(self.path.glob("*.torrent"), key=lambda f: f.stat().st_mtime)
+        total = sum(f.stat().st_size for f in files)
+        removed = set()
+        for file in files:
+            if total <= self.max_size:
+                break
+            total -= file.stat().st_size
+            file.unlink()
+            removed.add(file.stem)
+        if removed:
+            self._index = {
+                url: _hash for url, _hash in self.index.items() if _hash not in removed
+            }
+            logger.debug(f"[Downloader] Evicted {len(removed)} cached torrents.")
+
+
+torrent_cache = TorrentCache()
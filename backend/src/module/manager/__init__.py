@@ -1,3 +1,4 @@
 from .collector import SeasonCollector, eps_complete
 from .renamer import Renamer
 from .torrent import TorrentManager
+from .watcher import CompletionWatcher
@@ -1,9 +1,11 @@
+import hashlib
 import logging
 import re
 
 from module.conf import settings
+from module.database import Database
 from module.downloader import DownloadClient
-from module.models import EpisodeFile, Notification, SubtitleFile
+from module.models import EpisodeFile, Notification, RenameState, SubtitleFile
 from module.parser import TitleParser
 
 logger = logging.getLogger(__name__)
@@ -13,7 +15,8 @@ class Renamer(DownloadClient):
     def __init__(self):
         super().__init__()
         self._parser = TitleParser()
-        self.check_pool = {}
+        self._parsed = {}
+        self._failed = set()
 
     @staticmethod
     def print_result(torrent_count, rename_count):
@@ -48,6 +51,36 @@ class Renamer(DownloadClient):
             logger.error(f"[Renamer] Unknown rename method: {method}")
             return file_info.media_path
 
+    def _torrent_parser(
+            self,
+            torrent_path: str,
+            torrent_name: str | None = None,
+            season: int | None = None,
+            file_type: str = "media",
+    ):
+        job = (torrent_path, torrent_name, season, file_type)
+        if job in self._parsed:
+            return self._parsed[job]
+        return self._parser.torrent_parser(*job)
+
+    def _parse_all(self, torrents: list) -> dict:
+        # Parse every file of this run up front, in one batch
+        jobs = []
+        for info, media_list, subtitle_list, _, season in torrents:
+            if len(media_list) == 1:
+                jobs.append((media_list[0], info.name, season, "media"))
+            elif len(media_list) > 1:
+                jobs += [
+                    (path, None, season, "media")
+                    for path in media_list
+                    if self.is_ep(path)
+                ]
+            if media_list:
+                jobs += [
+                    (path, info.name, season, "subtitle") for path in subtitle_list
+                ]
+        return dict(zip(jobs, self._parser.torrent_parse_many(jobs)))
+
     def rename_file(
             self,
             torrent_name: str,
@@ -58,7 +91,7 @@ class Renamer(DownloadClient):
             _hash: str,
             **kwargs,
     ):
-        ep = self._parser.torrent_parser(
+        ep = self._torrent_parser(
             torrent_name=torrent_name,
             torrent_path=media_path,
             season=season,
@@ -66,17 +99,18 @@ class Renamer(DownloadClient):
         if ep:
             new_path = self.gen_path(ep, bangumi_name, method=method)
             if media_path != new_path:
-                if new_path not in self.check_pool.keys():
-                    if self.rename_torrent_file(
-                        _hash=_hash, old_path=media_path, new_path=new_path
-                    ):
-                        return Notification(
-                            official_title=bangumi_name,
-                            season=ep.season,
-                            episode=ep.episode,
-                        )
+                if self.rename_torrent_file(
+                    _hash=_hash, old_path=media_path, new_path=new_path
+                ):
+                    return Notification(
+                        official_title=bangumi_name,
+                        season=ep.season,
+                        episode=ep.episode,
+                    )
+                self._failed.add(_hash)
         else:
             logger.warning(f"[Renamer] {media_path} parse failed")
+            self._failed.add(_hash)
             if settings.bangumi_manage.remove_bad_torrent:
                 self.delete_torrent(hashes=_hash)
         return None
@@ -92,7 +126,7 @@ class Renamer(DownloadClient):
     ):
         for media_path in media_list:
             if self.is_ep(media_path):
-                ep = self._parser.torrent_parser(
+                ep = self._torrent_parser(
                     torrent_path=media_path,
                     season=season,
                 )
@@ -104,6 +138,7 @@ class Renamer(DownloadClient):
                         )
                         if not renamed:
                             logger.warning(f"[Renamer] {media_path} rename failed")
+                            self._failed.add(_hash)
                             # Delete bad torrent.
                             if settings.bangumi_manage.remove_bad_torrent:
                                 self.delete_torrent(_hash)
@@ -121,7 +156,7 @@ class Renamer(DownloadClient):
     ):
         method = "subtitle_" + method
         for subtitle_path in subtitle_list:
-            sub = self._parser.torrent_parser(
+            sub = self._torrent_parser(
                 torrent_path=subtitle_path,
                 torrent_name=torrent_name,
                 season=season,
@@ -135,16 +170,38 @@ class Renamer(DownloadClient):
                     )
                     if not renamed:
                         logger.warning(f"[Renamer] {subtitle_path} rename failed")
+                        self._failed.add(_hash)
 
-    def rename(self) -> list[Notification]:
-        # Get torrent info
+    def rename(self, hashes: list[str] | None = None) -> list[Notification]:
+        # Get torrent info, only for the given torrents when hashes is set
         logger.debug("[Renamer] Start rename process.")
         rename_method = settings.bangumi_manage.rename_method
-        torrents_info = self.get_torrent_info()
+        torrents_info = self.get_torrent_info(
+            hashes="|".join(hashes) if hashes else None
+        )
+        if torrents_info is None:
+            return []
+        with Database() as db:
+            states = db.rename.search_all()
         renamed_info: list[Notification] = []
+        torrents = []
+        fingerprints = {}
         for info in torrents_info:
+            fingerprint = self._fingerprint(info)
+            state = states.get(info.hash)
+            if (
+                state
+                and state.fingerprint == fingerprint
+                and state.rename_method == rename_method
+            ):
+                # Renamed before and nothing changed since
+                continue
+            fingerprints[info.hash] = fingerprint
             media_list, subtitle_list = self.check_files(info)
             bangumi_name, season = self._path_to_bangumi(info.save_path)
+            torrents.append((info, media_list, subtitle_list, bangumi_name, season))
+        self._parsed = self._parse_all(torrents)
+        for info, media_list, subtitle_list, bangumi_name, season in torrents:
             kwargs = {
                 "torrent_name": info.name,
                 "bangumi_name": bangumi_name,
@@ -169,9 +226,44 @@ class Renamer(DownloadClient):
                 self.set_category(info.hash, "BangumiCollection")
             else:
                 logger.warning(f"[Renamer] {info.name} has no media file")
+        self._parsed = {}
+        self._save_states(
+            states, torrents_info, fingerprints, rename_method, prune=hashes is None
+        )
         logger.debug("[Renamer] Rename process finished.")
         return renamed_info
 
+    @staticmethod
+    def _fingerprint(info) -> str:
+        # The files of a completed torrent only change if it is moved or re-added
+        data = f"{info.name}|{info.save_path}|{info.size}|{info.added_on}"
+        return hashlib.md5(data.encode()).hexdigest()
+
+    def _save_states(
+            self,
+            states: dict[str, RenameState],
+            torrents_info: list,
+            fingerprints: dict[str, str],
+            method: str,
+            prune: bool = True,
+    ):
+        # Only remember torrents whose files were all handled
+        done = [
+            RenameState(hash=_hash, fingerprint=fingerprint, rename_method=method)
+            for _hash, fingerprint in fingerprints.items()
+            if _hash not in self._failed
+        ]
+        stale = []
+        if prune:
+            current = {info.hash for info in torrents_info}
+            stale = [_hash for _hash in states if _hash not in current]
+        self._failed = set()
+        with Database() as db:
+            if done:
+                db.rename.add_all(done)
+            if stale:
+                db.rename.delete_hashes(stale)
+
     def compare_ep_version(self, torrent_name: str, torrent_hash: str):
         if re.search(r"v\d.", torrent_name):
             pass
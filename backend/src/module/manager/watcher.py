@@ -0,0 +1,45 @@
+import logging
+
+from module.downloader import DownloadClient
+
+logger = logging.getLogger(__name__)
+
+
+class CompletionWatcher:
+    """
+    Follow the qBittorrent sync API and report torrents that just finished.
+
+    Each poll sends the last rid, so qBittorrent only answers with what changed.
+    Torrents already complete on the first poll are left to the full scan.
+    """
+
+    def __init__(self, client: DownloadClient, category: str = "Bangumi"):
+        self.client = client
+        self.category = category
+        self.rid = 0
+        self._torrents: dict[str, dict] = {}
+
+    def poll(self) -> list[str]:
+        first_poll = self.rid == 0
+        data = self.client.get_sync_data(self.rid)
+        self.rid = data.get("rid", 0)
+        previous = self._torrents
+        if data.get("full_update"):
+            self._torrents = {}
+        for _hash in data.get("torrents_removed", []):
+            self._torrents.pop(_hash, None)
+        completed = []
+        for _hash, delta in (data.get("torrents") or {}).items():
+            was_done = previous.get(_hash, {}).get("progress", 0) >= 1
+            torrent = {**previous.get(_hash, {}), **delta}
+            self._torrents[_hash] = torrent
+            if (
+                not first_poll
+                and not was_done
+                and torrent.get("progress", 0) >= 1
+                and torrent.get("category") == self.category
+            ):
+                completed.append(_hash)
+        if completed:
+            logger.debug(f"[Renamer] {len(completed)} torrents finished downloading.")
+        return completed
@@ -1,6 +1,14 @@
-from .bangumi import Bangumi, BangumiUpdate, Episode, Notification
+from .bangumi import Bangumi, BangumiRSS, BangumiUpdate, Episode, Notification
+from .cache import Cache
 from .config import Config
+from .notification import NotificationRetry
 from .response import APIResponse, ResponseModel
-from .rss import RSSItem, RSSUpdate
-from .torrent import EpisodeFile, SubtitleFile, Torrent, TorrentUpdate
+from .rss import RSSItem, RSSMarker, RSSUpdate, RSSValidator
+from .torrent import (
+    EpisodeFile,
+    RenameState,
+    SubtitleFile,
+    Torrent,
+    TorrentUpdate,
+)
 from .user import User, UserLogin, UserUpdate
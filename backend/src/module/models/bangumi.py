@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Union
 
 from pydantic import BaseModel
 from sqlmodel import Field, SQLModel
@@ -8,17 +8,21 @@ from sqlmodel import Field, SQLModel
 class Bangumi(SQLModel, table=True):
     id: int = Field(default=None, primary_key=True)
     official_title: str = Field(
-        default="official_title", alias="official_title", title="番剧中文名"
+        default="official_title", alias="official_title", title="番剧中文名", index=True
     )
     year: Optional[str] = Field(alias="year", title="番剧年份")
-    title_raw: str = Field(default="title_raw", alias="title_raw", title="番剧原名")
+    title_raw: str = Field(
+        default="title_raw", alias="title_raw", title="番剧原名", index=True
+    )
     season: int = Field(default=1, alias="season", title="番剧季度")
     season_raw: Optional[str] = Field(alias="season_raw", title="番剧季度原名")
     group_name: Optional[str] = Field(alias="group_name", title="字幕组")
     dpi: Optional[str] = Field(alias="dpi", title="分辨率")
     source: Optional[str] = Field(alias="source", title="来源")
     subtitle: Optional[str] = Field(alias="subtitle", title="字幕")
-    eps_collect: bool = Field(default=False, alias="eps_collect", title="是否已收集")
+    eps_collect: bool = Field(
+        default=False, alias="eps_collect", title="是否已收集", index=True
+    )
     offset: int = Field(default=0, alias="offset", title="番剧偏移量")
     filter: str = Field(default="720,\\d+-\\d+", alias="filter", title="番剧过滤器")
     rss_link: str = Field(default="", alias="rss_link", title="番剧RSS链接")
@@ -26,7 +30,15 @@ class Bangumi(SQLModel, table=True):
     added: bool = Field(default=False, alias="added", title="是否已添加")
     rule_name: Optional[str] = Field(alias="rule_name", title="番剧规则名")
     save_path: Optional[str] = Field(alias="save_path", title="番剧保存路径")
-    deleted: bool = Field(False, alias="deleted", title="是否已删除")
+    deleted: bool = Field(False, alias="deleted", title="是否已删除", index=True)
+
+
+class BangumiRSS(SQLModel, table=True):
+    # One row per RSS link of a bangumi, Bangumi.rss_link keeps the joined form
+    __tablename__ = "bangumi_rss"
+
+    bangumi_id: int = Field(primary_key=True, foreign_key="bangumi.id")
+    rss_link: str = Field(primary_key=True, alias="rss_link", index=True)
 
 
 class BangumiUpdate(SQLModel):
@@ -55,11 +67,11 @@ class BangumiUpdate(SQLModel):
 class Notification(BaseModel):
     official_title: str = Field(..., alias="official_title", title="番剧名")
     season: int = Field(..., alias="season", title="番剧季度")
-    episode: int = Field(..., alias="episode", title="番剧集数")
+    episode: Union[int, str] = Field(..., alias="episode", title="番剧集数")
     poster_path: Optional[str] = Field(None, alias="poster_path", title="番剧海报路径")
 
 
-@dataclass
+@dataclass(frozen=True)
 class Episode:
     title_en: Optional[str]
     title_zh: Optional[str]
@@ -0,0 +1,7 @@
+from sqlmodel import Field, SQLModel
+
+
+class Cache(SQLModel, table=True):
+    key: str = Field(primary_key=True, alias="key")
+    value: str = Field(alias="value")
+    created_at: float = Field(index=True, alias="created_at")
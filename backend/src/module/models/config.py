@@ -7,7 +7,11 @@ from pydantic import BaseModel, Field, validator
 class Program(BaseModel):
     rss_time: int = Field(900, description="Sleep time")
     rename_time: int = Field(60, description="Rename times in one loop")
+    rename_watch: bool = Field(True, description="Rename on download completion")
+    rename_token: str = Field("", description="Token of the rename webhook")
     webui_port: int = Field(7892, description="WebUI port")
+    parser_workers: int = Field(0, description="Parser processes, 0 to disable")
+    parser_threshold: int = Field(500, description="Min batch size for processes")
 
 
 class Downloader(BaseModel):
@@ -19,6 +23,9 @@ class Downloader(BaseModel):
     )
     path: str = Field("/downloads/Bangumi", description="Downloader path")
     ssl: bool = Field(False, description="Downloader ssl")
+    torrent_cache_size: int = Field(
+        100, description="Torrent file cache size in MB, 0 to disable"
+    )
 
     @property
     def host(self):
@@ -37,6 +44,10 @@ class RSSParser(BaseModel):
     enable: bool = Field(True, description="Enable RSS parser")
     filter: list[str] = Field(["720", r"\d+-\d"], description="Filter")
     language: str = "zh"
+    fetch_workers: int = Field(8, description="Max concurrent RSS fetches")
+    host_limit: int = Field(4, description="Max concurrent requests per host")
+    tmdb_cache_ttl: int = Field(7, description="TMDB cache TTL in days")
+    tmdb_cache_size: int = Field(5000, description="Max cached TMDB responses")
 
 
 class BangumiManage(BaseModel):
@@ -0,0 +1,12 @@
+from typing import Optional
+
+from sqlmodel import Field, SQLModel
+
+
+class NotificationRetry(SQLModel, table=True):
+    id: int = Field(default=None, primary_key=True)
+    official_title: str = Field(alias="official_title", title="番剧名")
+    season: int = Field(alias="season", title="番剧季度")
+    episode: str = Field(alias="episode", title="番剧集数")
+    poster_path: Optional[str] = Field(None, alias="poster_path", title="番剧海报路径")
+    attempts: int = Field(default=0, alias="attempts", title="重试次数")
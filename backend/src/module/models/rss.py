@@ -18,3 +18,16 @@ class RSSUpdate(SQLModel):
     aggregate: Optional[bool] = Field(True, alias="aggregate")
     parser: Optional[str] = Field("mikan", alias="parser")
     enabled: Optional[bool] = Field(True, alias="enabled")
+
+
+class RSSValidator(SQLModel, table=True):
+    url: str = Field(primary_key=True, alias="url")
+    etag: Optional[str] = Field(None, alias="etag")
+    last_modified: Optional[str] = Field(None, alias="last_modified")
+    content_hash: Optional[str] = Field(None, alias="content_hash")
+
+
+class RSSMarker(SQLModel, table=True):
+    # Newest torrent of the feed which the analyser has handled
+    url: str = Field(primary_key=True, alias="url")
+    last_analysed: Optional[str] = Field(None, alias="last_analysed")
@@ -9,11 +9,17 @@ class Torrent(SQLModel, table=True):
     bangumi_id: Optional[int] = Field(None, alias="refer_id", foreign_key="bangumi.id")
     rss_id: Optional[int] = Field(None, alias="rss_id", foreign_key="rssitem.id")
     name: str = Field("", alias="name")
-    url: str = Field("https://example.com/torrent", alias="url")
+    url: str = Field("https://example.com/torrent", alias="url", index=True)
     homepage: Optional[str] = Field(None, alias="homepage")
     downloaded: bool = Field(False, alias="downloaded")
 
 
+class RenameState(SQLModel, table=True):
+    hash: str = Field(primary_key=True, alias="hash")
+    fingerprint: str = Field(alias="fingerprint")
+    rename_method: str = Field(alias="rename_method")
+
+
 class TorrentUpdate(SQLModel):
     downloaded: bool = Field(False, alias="downloaded")
 
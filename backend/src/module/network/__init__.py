@@ -1 +1,2 @@
+from .async_contents import AsyncRequestContent
 from .request_contents import RequestContent
@@ -0,0 +1,53 @@
+import asyncio
+
+from module.models import Torrent
+
+from .request_contents import RequestContent
+
+
+class AsyncRequestContent:
+    """
+    Awaitable counterpart of RequestContent.
+
+    Requests run in the default executor over the shared pooled session,
+    so awaiting them never blocks the event loop.
+    """
+
+    def __init__(self):
+        self._req = RequestContent()
+
+    async def get_torrents(
+        self,
+        _url: str,
+        _filter: str = None,
+        limit: int = None,
+        retry: int = 3,
+    ) -> list[Torrent]:
+        return await asyncio.to_thread(
+            self._req.get_torrents, _url, _filter, limit, retry
+        )
+
+    async def get_json(self, _url) -> dict:
+        return await asyncio.to_thread(self._req.get_json, _url)
+
+    async def get_content(self, _url):
+        return await asyncio.to_thread(self._req.get_content, _url)
+
+    async def get_html(self, _url):
+        return await asyncio.to_thread(self._req.get_html, _url)
+
+    async def post_data(self, _url, data: dict):
+        return await asyncio.to_thread(self._req.post_data, _url, data)
+
+    async def post_files(self, _url, data: dict, files: dict):
+        return await asyncio.to_thread(self._req.post_files, _url, data, files)
+
+    async def get_rss_title(self, _url):
+        return await asyncio.to_thread(self._req.get_rss_title, _url)
+
+    async def __aenter__(self):
+        self._req.__enter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._req.__exit__(exc_type, exc_val, exc_tb)
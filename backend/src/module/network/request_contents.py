@@ -1,9 +1,14 @@
+import hashlib
+import io
 import logging
-import re
 import xml.etree.ElementTree
+from typing import IO, Iterator
+
+from requests import Response
 
 from module.conf import settings
-from module.models import Torrent
+from module.models import RSSValidator, Torrent
+from module.utils import compile_filter
 
 from .request_url import RequestURL
 from .site import rss_parser
@@ -18,28 +23,69 @@ class RequestContent(RequestURL):
         _filter: str = None,
         limit: int = None,
         retry: int = 3,
+        validator: RSSValidator | None = None,
     ) -> list[Torrent]:
-        soup = self.get_xml(_url, retry)
-        if soup:
-            torrent_titles, torrent_urls, torrent_homepage = rss_parser(soup)
-            torrents: list[Torrent] = []
-            if _filter is None:
-                _filter = "|".join(settings.rss_parser.filter)
-            for _title, torrent_url, homepage in zip(
-                torrent_titles, torrent_urls, torrent_homepage
-            ):
-                if re.search(_filter, _title) is None:
-                    torrents.append(
-                        Torrent(name=_title, url=torrent_url, homepage=homepage)
-                    )
-                if isinstance(limit, int):
-                    if len(torrents) >= limit:
-                        break
-            return torrents
+        req = self.get_url(_url, retry, self._conditional_headers(validator))
+        if req and validator is not None and not self._check_modified(req, validator):
+            logger.debug(f"[Network] Not modified since last fetch: {_url}")
+            return []
+        if req:
+            return list(self._parse_torrents(io.BytesIO(req.content), _filter, limit))
         else:
             logger.warning(f"[Network] Failed to get torrents: {_url}")
             return []
 
+    def iter_torrents(
+        self, _url: str, _filter: str = None, retry: int = 3
+    ) -> Iterator[Torrent]:
+        # Stream the feed, stop reading once the caller stops iterating.
+        req = self.get_url(_url, retry, stream=True)
+        if not req:
+            logger.warning(f"[Network] Failed to get torrents: {_url}")
+            return
+        with req:
+            req.raw.decode_content = True
+            yield from self._parse_torrents(req.raw, _filter)
+
+    @staticmethod
+    def _parse_torrents(
+        source: IO[bytes], _filter: str = None, limit: int = None
+    ) -> Iterator[Torrent]:
+        if _filter is None:
+            _filter = "|".join(settings.rss_parser.filter)
+        pattern = compile_filter(_filter)
+        count = 0
+        for _title, torrent_url, homepage in rss_parser(source):
+            if pattern is None or pattern.search(_title) is None:
+                yield Torrent(name=_title, url=torrent_url, homepage=homepage)
+                count += 1
+            if isinstance(limit, int):
+                if count >= limit:
+                    break
+
+    @staticmethod
+    def _conditional_headers(validator: RSSValidator | None) -> dict | None:
+        if validator is None:
+            return None
+        headers = {}
+        if validator.etag:
+            headers["If-None-Match"] = validator.etag
+        if validator.last_modified:
+            headers["If-Modified-Since"] = validator.last_modified
+        return headers
+
+    @staticmethod
+    def _check_modified(req: Response, validator: RSSValidator) -> bool:
+        if req.status_code == 304:
+            return False
+        # Fallback for servers which do not send validators
+        content_hash = hashlib.md5(req.content).hexdigest()
+        modified = content_hash != validator.content_hash
+        validator.etag = req.headers.get("ETag")
+        validator.last_modified = req.headers.get("Last-Modified")
+        validator.content_hash = content_hash
+        return modified
+
     def get_xml(self, _url, retry: int = 3) -> xml.etree.ElementTree.Element:
         req = self.get_url(_url, retry)
         if req:
@@ -1,71 +1,113 @@
 import logging
-import socket
-import time
+import threading
+from urllib.parse import quote, urlparse
 
 import requests
-import socks
+from requests.adapters import HTTPAdapter
 
 from module.conf import settings
+from module.utils import RetryPolicy, host_breaker
 
 logger = logging.getLogger(__name__)
 
+_session: requests.Session | None = None
+_session_proxy: str | None = None
+_session_lock = threading.Lock()
+
+
+def _proxy_url() -> str | None:
+    if not settings.proxy.enable:
+        return None
+    auth = ""
+    if settings.proxy.username:
+        username = quote(settings.proxy.username, safe="")
+        password = quote(settings.proxy.password, safe="")
+        auth = f"{username}:{password}@"
+    if "http" in settings.proxy.type:
+        return f"http://{auth}{settings.proxy.host}:{settings.proxy.port}"
+    elif settings.proxy.type == "socks5":
+        # socks5h resolves DNS through the proxy
+        return f"socks5h://{auth}{settings.proxy.host}:{settings.proxy.port}"
+    else:
+        logger.error(f"[Network] Unsupported proxy type: {settings.proxy.type}")
+        return None
+
+
+def get_session() -> requests.Session:
+    """Process-wide keep-alive session, rebuilt when the proxy settings change."""
+    global _session, _session_proxy
+    proxy = _proxy_url()
+    with _session_lock:
+        if _session is None or proxy != _session_proxy:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=settings.rss_parser.host_limit)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            if proxy:
+                session.proxies = {"http": proxy, "https": proxy}
+            _session, _session_proxy = session, proxy
+        return _session
+
 
 class RequestURL:
     def __init__(self):
         self.header = {"user-agent": "Mozilla/5.0", "Accept": "application/xml"}
-        self._socks5_proxy = False
 
-    def get_url(self, url, retry=3):
-        try_time = 0
-        while True:
+    def _request(self, method: str, url: str, retry: int, **kwargs):
+        host = urlparse(url).netloc
+        for _ in RetryPolicy(attempts=retry):
+            if not host_breaker.allow(host):
+                logger.warning(f"[Network] {host} keeps failing, skip {url}.")
+                return None
             try:
-                req = self.session.get(url=url, headers=self.header, timeout=5)
-                logger.debug(f"[Network] Successfully connected to {url}. Status: {req.status_code}")
-                req.raise_for_status()
-                return req
-            except requests.RequestException:
+                req = self.session.request(method, url=url, timeout=5, **kwargs)
                 logger.debug(
-                    f"[Network] Cannot connect to {url}. Wait for 5 seconds."
-                )
-                try_time += 1
-                if try_time >= retry:
-                    break
-                time.sleep(5)
-            except Exception as e:
-                logger.debug(e)
-                break
-        logger.error(f"[Network] Unable to connect to {url}, Please check your network settings")
-        return None
-
-    def post_url(self, url: str, data: dict, retry=3):
-        try_time = 0
-        while True:
-            try:
-                req = self.session.post(
-                    url=url, headers=self.header, data=data, timeout=5
+                    f"[Network] Successfully connected to {url}. Status: {req.status_code}"
                 )
                 req.raise_for_status()
+                host_breaker.success(host)
                 return req
-            except requests.RequestException:
-                logger.warning(
-                    f"[Network] Cannot connect to {url}. Wait for 5 seconds."
-                )
-                try_time += 1
-                if try_time >= retry:
+            except requests.HTTPError as e:
+                status = e.response.status_code
+                if status < 500 and status != 429:
+                    # The host is up, asking again will not change the answer.
+                    host_breaker.success(host)
+                    logger.debug(f"[Network] {url} returned {status}.")
                     break
-                time.sleep(5)
+                host_breaker.failure(host)
+                logger.debug(f"[Network] {url} returned {status}. Retrying.")
+            except requests.RequestException:
+                host_breaker.failure(host)
+                logger.debug(f"[Network] Cannot connect to {url}. Retrying.")
             except Exception as e:
                 logger.debug(e)
                 break
-        logger.error(f"[Network] Failed connecting to {url}")
-        logger.warning("[Network] Please check DNS/Connection settings")
         return None
 
+    def get_url(self, url, retry=3, headers: dict | None = None, stream=False):
+        if headers:
+            headers = {**self.header, **headers}
+        else:
+            headers = self.header
+        req = self._request("GET", url, retry, headers=headers, stream=stream)
+        if req is None:
+            logger.error(
+                f"[Network] Unable to connect to {url}, Please check your network settings"
+            )
+        return req
+
+    def post_url(self, url: str, data: dict, retry=3):
+        req = self._request("POST", url, retry, headers=self.header, data=data)
+        if req is None:
+            logger.error(f"[Network] Failed connecting to {url}")
+            logger.warning("[Network] Please check DNS/Connection settings")
+        return req
+
     def check_url(self, url: str):
         if "://" not in url:
             url = f"http://{url}"
         try:
-            req = requests.head(url=url, headers=self.header, timeout=5)
+            req = self.session.head(url=url, headers=self.header, timeout=5)
             req.raise_for_status()
             return True
         except requests.RequestException:
@@ -84,41 +126,9 @@ class RequestURL:
             return None
 
     def __enter__(self):
-        self.session = requests.Session()
-        if settings.proxy.enable:
-            if "http" in settings.proxy.type:
-                if settings.proxy.username:
-                    username=settings.proxy.username
-                    password=settings.proxy.password
-                    url = f"http://{username}:{password}@{settings.proxy.host}:{settings.proxy.port}"
-                    self.session.proxies = {
-                        "http": url,
-                        "https": url,
-                    }
-                else:
-                    url = f"http://{settings.proxy.host}:{settings.proxy.port}"
-                    self.session.proxies = {
-                        "http": url,
-                        "https": url,
-                    }
-            elif settings.proxy.type == "socks5":
-                self._socks5_proxy = True
-                socks.set_default_proxy(
-                    socks.SOCKS5,
-                    addr=settings.proxy.host,
-                    port=settings.proxy.port,
-                    rdns=True,
-                    username=settings.proxy.username,
-                    password=settings.proxy.password,
-                )
-                socket.socket = socks.socksocket
-            else:
-                logger.error(f"[Network] Unsupported proxy type: {settings.proxy.type}")
+        self.session = get_session()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self._socks5_proxy:
-            socks.set_default_proxy()
-            socket.socket = socks.socksocket
-            self._socks5_proxy = False
-        self.session.close()
+        # The session is shared, keep its connections alive for other requests.
+        pass
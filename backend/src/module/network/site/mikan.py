@@ -1,17 +1,19 @@
-def rss_parser(soup):
-    torrent_titles = []
-    torrent_urls = []
-    torrent_homepage = []
-    for item in soup.findall("./channel/item"):
-        torrent_titles.append(item.find("title").text)
+import xml.etree.ElementTree
+from typing import IO, Iterator
+
+
+def rss_parser(source: IO[bytes]) -> Iterator[tuple[str, str, str]]:
+    # Parse items one by one and free them, feeds can be large.
+    for _, item in xml.etree.ElementTree.iterparse(source):
+        if item.tag != "item":
+            continue
+        title = item.find("title").text
         enclosure = item.find("enclosure")
         if enclosure is not None:
-            torrent_homepage.append(item.find("link").text)
-            torrent_urls.append(enclosure.attrib.get("url"))
+            yield title, enclosure.attrib.get("url"), item.find("link").text
         else:
-            torrent_urls.append(item.find("link").text)
-            torrent_homepage.append("")
-    return torrent_titles, torrent_urls, torrent_homepage
+            yield title, item.find("link").text, ""
+        item.clear()
 
 
 def mikan_title(soup):
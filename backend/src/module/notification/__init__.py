@@ -1 +1,2 @@
+from .dispatcher import NotificationDispatcher
 from .notification import PostNotification
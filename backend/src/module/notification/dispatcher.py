@@ -0,0 +1,175 @@
+import logging
+import queue
+import threading
+import time
+
+from module.conf import settings
+from module.database import Database
+from module.models import Notification, NotificationRetry
+
+from .notification import PostNotification
+
+logger = logging.getLogger(__name__)
+
+BATCH_WINDOW = 10
+RETRY_INTERVAL = 300
+MAX_ATTEMPTS = 5
+# Seconds between two messages of the same provider
+RATE_LIMITS = {
+    "telegram": 1,
+    "server-chan": 5,
+    "bark": 1,
+    "wecom": 3,
+}
+
+
+def digest(notifications: list[Notification]) -> list[Notification]:
+    # One message per season, listing every episode renamed in the batch
+    groups: dict[tuple[str, int], list[Notification]] = {}
+    for notify in notifications:
+        groups.setdefault((notify.official_title, notify.season), []).append(notify)
+    digests = []
+    for (official_title, season), items in groups.items():
+        episodes = sorted({notify.episode for notify in items})
+        poster_path = next(
+            (notify.poster_path for notify in items if notify.poster_path), None
+        )
+        digests.append(
+            Notification(
+                official_title=official_title,
+                season=season,
+                episode=(
+                    episodes[0]
+                    if len(episodes) == 1
+                    else ", ".join(str(ep) for ep in episodes)
+                ),
+                poster_path=poster_path,
+            )
+        )
+    return digests
+
+
+class NotificationDispatcher:
+    """
+    Send notifications from a background thread.
+
+    Notifications put in the same batch window are merged into one message per
+    season. Messages which fail are stored in the database and retried later.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop)
+        self._last_sent = 0.0
+
+    def put(self, notifications: list[Notification]):
+        for notify in notifications:
+            self._queue.put(notify)
+
+    def start(self):
+        if not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop)
+            self._thread.start()
+
+    def stop(self):
+        if self._thread.is_alive():
+            self._stop.set()
+            self._thread.join()
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self._safe_dispatch(self._collect())
+        # Send what is left before exiting
+        self._safe_dispatch(self._drain())
+
+    def _safe_dispatch(self, notifications: list[Notification]):
+        # Any error must not end the thread, the queue would never drain again
+        try:
+            self._dispatch(notifications)
+        except Exception:
+            logger.exception("[Notification] Failed to dispatch notifications.")
+            self._keep(notifications)
+
+    def _keep(self, notifications: list[Notification]):
+        # Store the batch for retry, or hold it in memory if the database fails
+        if not notifications:
+            return
+        try:
+            with Database() as db:
+                db.notification.add_all(
+                    [self._to_retry(notify) for notify in digest(notifications)]
+                )
+        except Exception:
+            logger.exception("[Notification] Failed to store notifications.")
+            self.put(notifications)
+            self._stop.wait(RETRY_INTERVAL)
+
+    def _collect(self) -> list[Notification]:
+        retry_at = time.monotonic() + RETRY_INTERVAL
+        while not self._stop.is_set() and time.monotonic() < retry_at:
+            try:
+                notify = self._queue.get(timeout=1)
+            except queue.Empty:
+                continue
+            # Give the rest of the batch time to arrive
+            self._stop.wait(BATCH_WINDOW)
+            return [notify] + self._drain()
+        return []
+
+    def _drain(self) -> list[Notification]:
+        notifications = []
+        while not self._queue.empty():
+            notifications.append(self._queue.get_nowait())
+        return notifications
+
+    def _dispatch(self, notifications: list[Notification]):
+        digests = digest(notifications)
+        with Database() as db:
+            retries = db.notification.search_all()
+            # Look up every poster in one session
+            for notify in digests:
+                if notify.poster_path is None:
+                    notify.poster_path = db.bangumi.match_poster(notify.official_title)
+        if not digests and not retries:
+            return
+        done, failed = [], []
+        with PostNotification() as notifier:
+            for retry in retries:
+                if self._send(notifier, Notification(**retry.dict())):
+                    done.append(retry.id)
+                elif retry.attempts + 1 >= MAX_ATTEMPTS:
+                    logger.warning(
+                        f"[Notification] Give up notifying {retry.official_title}."
+                    )
+                    done.append(retry.id)
+                else:
+                    retry.attempts += 1
+                    failed.append(retry)
+            for notify in digests:
+                if not self._send(notifier, notify):
+                    failed.append(self._to_retry(notify))
+        with Database() as db:
+            if done:
+                db.notification.delete_ids(done)
+            if failed:
+                db.notification.add_all(failed)
+
+    @staticmethod
+    def _to_retry(notify: Notification) -> NotificationRetry:
+        return NotificationRetry(
+            official_title=notify.official_title,
+            season=notify.season,
+            episode=str(notify.episode),
+            poster_path=notify.poster_path,
+            attempts=1,
+        )
+
+    def _send(self, notifier: PostNotification, notify: Notification) -> bool:
+        interval = RATE_LIMITS.get(settings.notification.type.lower(), 2)
+        wait = self._last_sent + interval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._last_sent = time.monotonic()
+        return notifier.send_msg(notify)
@@ -41,10 +41,12 @@ class PostNotification:
         notify.poster_path = poster_path
 
     def send_msg(self, notify: Notification) -> bool:
-        self._get_poster(notify)
+        if notify.poster_path is None:
+            self._get_poster(notify)
         try:
-            self.notifier.post_msg(notify)
+            sent = self.notifier.post_msg(notify)
             logger.debug(f"Send notification: {notify.official_title}")
+            return sent
         except Exception as e:
             logger.warning(f"Failed to send notification: {e}")
             return False
@@ -1,5 +1,6 @@
 import logging
 import re
+from functools import lru_cache
 
 from module.models import Episode
 
@@ -13,7 +14,21 @@ RESOLUTION_RE = re.compile(r"1080|720|2160|4K")
 SOURCE_RE = re.compile(r"B-Global|[Bb]aha|[Bb]ilibili|AT-X|Web")
 SUB_RE = re.compile(r"[简繁日字幕]|CH|BIG5|GB")
 
+GROUP_RE = re.compile(r"[\[\]]([^\[\]]*)")
 PREFIX_RE = re.compile(r"[^\w\s\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff-]")
+SEASON_RE = re.compile(r"S\d{1,2}|Season \d{1,2}|[第].[季期]")
+SEASON_EN_RE = re.compile(r"Season|S")
+SEASON_CN_RE = re.compile(r"[第 ].*[季期(部分)]|部分")
+SEASON_CN_STRIP_RE = re.compile(r"[第季期 ]")
+REGION_RE = re.compile(r"[(（]仅限港澳台地区[）)]")
+NAME_SPLIT_RE = re.compile(r"/|\s{2}|-\s{2}")
+NAME_ZH_PREFIX_RE = re.compile(r"^[\u4e00-\u9fa5]{2,}")
+NAME_JP_RE = re.compile(r"[\u0800-\u4e00]{2,}")
+NAME_ZH_RE = re.compile(r"[\u4e00-\u9fa5]{2,}")
+NAME_EN_RE = re.compile(r"[a-zA-Z]{3,}")
+CLEAN_SUB_RE = re.compile(r"_MP4|_MKV")
+
+PARSER_CACHE_SIZE = 1024
 
 CHINESE_NUMBER_MAP = {
     "一": 1,
@@ -29,8 +44,15 @@ CHINESE_NUMBER_MAP = {
 }
 
 
+@lru_cache(maxsize=256)
+def wrapped_re(token: str) -> re.Pattern:
+    # Matches the token together with the characters around it, e.g. its brackets
+    return re.compile(f".{re.escape(token)}.")
+
+
 def get_group(name: str) -> str:
-    return re.split(r"[\[\]]", name)[1]
+    # Text between the first two brackets
+    return GROUP_RE.search(name).group(1)
 
 
 def pre_process(raw_name: str) -> str:
@@ -38,40 +60,32 @@ def pre_process(raw_name: str) -> str:
 
 
 def prefix_process(raw: str, group: str) -> str:
-    raw = re.sub(f".{group}.", "", raw)
-    raw_process = PREFIX_RE.sub("/", raw)
-    arg_group = raw_process.split("/")
-    while "" in arg_group:
-        arg_group.remove("")
+    raw = wrapped_re(group).sub("", raw)
+    if "番" not in raw and "港澳台地区" not in raw:
+        return raw
+    arg_group = [arg for arg in PREFIX_RE.split(raw) if arg]
     if len(arg_group) == 1:
         arg_group = arg_group[0].split(" ")
     for arg in arg_group:
-        if re.search(r"新番|月?番", arg) and len(arg) <= 5:
-            raw = re.sub(f".{arg}.", "", raw)
-        elif re.search(r"港澳台地区", arg):
-            raw = re.sub(f".{arg}.", "", raw)
+        # "新番|月?番" and "港澳台地区" only ever need a substring test
+        if ("番" in arg and len(arg) <= 5) or "港澳台地区" in arg:
+            raw = wrapped_re(arg).sub("", raw)
     return raw
 
 
 def season_process(season_info: str):
-    name_season = season_info
-    # if re.search(r"新番|月?番", season_info):
-    #     name_season = re.sub(".*新番.", "", season_info)
-    #     # 去除「新番」信息
-    # name_season = re.sub(r"^[^]】]*[]】]", "", name_season).strip()
-    season_rule = r"S\d{1,2}|Season \d{1,2}|[第].[季期]"
-    name_season = re.sub(r"[\[\]]", " ", name_season)
-    seasons = re.findall(season_rule, name_season)
+    name_season = season_info.replace("[", " ").replace("]", " ")
+    seasons = SEASON_RE.findall(name_season)
     if not seasons:
         return name_season, "", 1
-    name = re.sub(season_rule, "", name_season)
+    name = SEASON_RE.sub("", name_season)
     for season in seasons:
         season_raw = season
-        if re.search(r"Season|S", season) is not None:
-            season = int(re.sub(r"Season|S", "", season))
+        if "S" in season:
+            season = int(SEASON_EN_RE.sub("", season))
             break
-        elif re.search(r"[第 ].*[季期(部分)]|部分", season) is not None:
-            season_pro = re.sub(r"[第季期 ]", "", season)
+        elif SEASON_CN_RE.search(season) is not None:
+            season_pro = SEASON_CN_STRIP_RE.sub("", season)
             try:
                 season = int(season_pro)
             except ValueError:
@@ -83,64 +97,82 @@ def season_process(season_info: str):
 def name_process(name: str):
     name_en, name_zh, name_jp = None, None, None
     name = name.strip()
-    name = re.sub(r"[(（]仅限港澳台地区[）)]", "", name)
-    split = re.split(r"/|\s{2}|-\s{2}", name)
-    while "" in split:
-        split.remove("")
+    if "仅限港澳台地区" in name:
+        name = REGION_RE.sub("", name)
+    split = [item for item in NAME_SPLIT_RE.split(name) if item]
     if len(split) == 1:
-        if re.search("_{1}", name) is not None:
-            split = re.split("_", name)
-        elif re.search(" - {1}", name) is not None:
-            split = re.split("-", name)
+        if "_" in name:
+            split = name.split("_")
+        elif " - " in name:
+            split = name.split("-")
     if len(split) == 1:
         split_space = split[0].split(" ")
         for idx in [0, -1]:
-            if re.search(r"^[\u4e00-\u9fa5]{2,}", split_space[idx]) is not None:
+            if NAME_ZH_PREFIX_RE.search(split_space[idx]) is not None:
                 chs = split_space[idx]
                 split_space.remove(chs)
                 split = [chs, " ".join(split_space)]
                 break
     for item in split:
-        if re.search(r"[\u0800-\u4e00]{2,}", item) and not name_jp:
+        # Japanese and Chinese ranges are all non-ASCII
+        if item.isascii():
+            if not name_en and NAME_EN_RE.search(item):
+                name_en = item.strip()
+        elif not name_jp and NAME_JP_RE.search(item):
             name_jp = item.strip()
-        elif re.search(r"[\u4e00-\u9fa5]{2,}", item) and not name_zh:
+        elif not name_zh and NAME_ZH_RE.search(item):
             name_zh = item.strip()
-        elif re.search(r"[a-zA-Z]{3,}", item) and not name_en:
+        elif not name_en and NAME_EN_RE.search(item):
             name_en = item.strip()
     return name_en, name_zh, name_jp
 
 
+@lru_cache(maxsize=1024)
+def tag_type(element: str) -> str | None:
+    # Tags such as "1080p", "CHT" or "Baha" repeat across titles
+    if SUB_RE.search(element):
+        return "sub"
+    elif RESOLUTION_RE.search(element):
+        return "resolution"
+    elif SOURCE_RE.search(element):
+        return "source"
+    return None
+
+
 def find_tags(other):
-    elements = re.sub(r"[\[\]()（）]", " ", other).split(" ")
-    # find CHT
-    sub, resolution, source = None, None, None
-    for element in filter(lambda x: x != "", elements):
-        if SUB_RE.search(element):
-            sub = element
-        elif RESOLUTION_RE.search(element):
-            resolution = element
-        elif SOURCE_RE.search(element):
-            source = element
-    return clean_sub(sub), resolution, source
+    elements = (
+        other.replace("[", " ")
+        .replace("]", " ")
+        .replace("(", " ")
+        .replace(")", " ")
+        .replace("（", " ")
+        .replace("）", " ")
+        .split(" ")
+    )
+    # The last matching element wins
+    tags = {tag_type(element): element for element in elements if element}
+    return clean_sub(tags.get("sub")), tags.get("resolution"), tags.get("source")
 
 
 def clean_sub(sub: str | None) -> str | None:
     if sub is None:
         return sub
-    return re.sub(r"_MP4|_MKV", "", sub)
+    return CLEAN_SUB_RE.sub("", sub)
+
+
+def normalize(raw_title: str) -> str:
+    return raw_title.strip().replace("\n", " ")
 
 
 def process(raw_title: str):
-    raw_title = raw_title.strip().replace("\n", " ")
+    raw_title = normalize(raw_title)
     content_title = pre_process(raw_title)
     # 预处理标题
     group = get_group(content_title)
     # 翻译组的名字
     match_obj = TITLE_RE.match(content_title)
     # 处理标题
-    season_info, episode_info, other = list(
-        map(lambda x: x.strip(), match_obj.groups())
-    )
+    season_info, episode_info, other = (x.strip() for x in match_obj.groups())
     process_raw = prefix_process(season_info, group)
     # 处理 前缀
     raw_name, season_raw, season = season_process(process_raw)
@@ -172,6 +204,12 @@ def process(raw_title: str):
 
 
 def raw_parser(raw: str) -> Episode | None:
+    return _cached_parser(normalize(raw))
+
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
+def _cached_parser(raw: str) -> Episode | None:
+    # Episode is frozen, so the cached result can be shared between callers
     ret = process(raw)
     if ret is None:
         logger.error(f"Parser cannot analyse {raw}")
@@ -182,6 +220,11 @@ def raw_parser(raw: str) -> Episode | None:
     )
 
 
+# Hit/miss counters and reset, same interface as functools.lru_cache
+raw_parser.cache_info = _cached_parser.cache_info
+raw_parser.cache_clear = _cached_parser.cache_clear
+
+
 if __name__ == "__main__":
     title = "[动漫国字幕组&LoliHouse] THE MARGINAL SERVICE - 08 [WebRip 1080p HEVC-10bit AAC][简繁内封字幕]"
     print(raw_parser(title))
@@ -1,11 +1,17 @@
+import logging
 import re
 import time
 from dataclasses import dataclass
 
-from module.conf import TMDB_API
+from sqlalchemy.exc import SQLAlchemyError
+
+from module.conf import TMDB_API, settings
+from module.database import Database
 from module.network import RequestContent
 from module.utils import save_image
 
+logger = logging.getLogger(__name__)
+
 TMDB_URL = "https://api.themoviedb.org"
 
 
@@ -31,13 +37,38 @@ def info_url(e, key):
     return f"{TMDB_URL}/3/tv/{e}?api_key={TMDB_API}&language={LANGUAGE[key]}"
 
 
-def is_animation(tv_id, language) -> bool:
-    url_info = info_url(tv_id, language)
-    with RequestContent() as req:
-        type_id = req.get_json(url_info)["genres"]
-        for type in type_id:
-            if type.get("id") == 16:
-                return True
+def cached_json(req: RequestContent, url: str, key: str) -> dict:
+    ttl = settings.rss_parser.tmdb_cache_ttl * 86400
+    try:
+        with Database() as db:
+            data = db.cache.get(key, ttl)
+    except SQLAlchemyError as e:
+        logger.debug(f"[TMDB] Cache unavailable: {e}")
+        data = None
+    if data is not None:
+        return data
+    data = req.get_json(url)
+    if data:
+        try:
+            with Database() as db:
+                db.cache.set(key, data, settings.rss_parser.tmdb_cache_size)
+        except SQLAlchemyError as e:
+            logger.debug(f"[TMDB] Cache unavailable: {e}")
+    return data
+
+
+def search_json(req: RequestContent, title: str) -> dict:
+    return cached_json(req, search_url(title), f"tmdb:search:{title}")
+
+
+def info_json(req: RequestContent, tv_id, language) -> dict:
+    return cached_json(req, info_url(tv_id, language), f"tmdb:info:{tv_id}:{language}")
+
+
+def is_animation(info_content: dict) -> bool:
+    for type in info_content["genres"]:
+        if type.get("id") == 16:
+            return True
     return False
 
 
@@ -58,19 +89,16 @@ def get_season(seasons: list) -> tuple[int, str]:
 
 def tmdb_parser(title, language, test: bool = False) -> TMDBInfo | None:
     with RequestContent() as req:
-        url = search_url(title)
-        contents = req.get_json(url).get("results")
+        contents = search_json(req, title).get("results")
         if contents.__len__() == 0:
-            url = search_url(title.replace(" ", ""))
-            contents = req.get_json(url).get("results")
+            contents = search_json(req, title.replace(" ", "")).get("results")
         # 判断动画
         if contents:
             for content in contents:
                 id = content["id"]
-                if is_animation(id, language):
+                info_content = info_json(req, id, language)
+                if is_animation(info_content):
                     break
-            url_info = info_url(id, language)
-            info_content = req.get_json(url_info)
             season = [
                 {
                     "season": s.get("name"),
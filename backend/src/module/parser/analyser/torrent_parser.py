@@ -1,5 +1,6 @@
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from module.models import EpisodeFile, SubtitleFile
@@ -16,6 +17,17 @@ RULES = [
     r"(.*)(?:S\d{2})?EP?(\d{1,4}(?:\.\d{1,2})?)(.*)",
 ]
 
+# Order matters: the first matching rule wins and several rules can match the
+# same name with different results.
+RULES_RE = [re.compile(rule, re.I) for rule in RULES]
+
+GROUP_RE = re.compile(r"[\[\]()【】（）]")
+NUMBER_RE = re.compile(r"\d+")
+SEASON_SUB_RE = re.compile(r"([Ss]|Season )\d{1,3}")
+SEASON_RE = re.compile(r"([Ss]|Season )(\d{1,3})", re.I)
+
+PARSER_CACHE_SIZE = 4096
+
 SUBTITLE_LANG = {
     "zh-tw": ["tc", "cht", "繁", "zh-tw"],
     "zh": ["sc", "chs", "简", "zh"],
@@ -35,11 +47,9 @@ def get_path_basename(torrent_path: str) -> str:
 
 
 def get_group(group_and_title) -> tuple[str | None, str]:
-    n = re.split(r"[\[\]()【】（）]", group_and_title)
-    while "" in n:
-        n.remove("")
+    n = [item for item in GROUP_RE.split(group_and_title) if item]
     if len(n) > 1:
-        if re.match(r"\d+", n[1]):
+        if NUMBER_RE.match(n[1]):
             return None, group_and_title
         return n[0], n[1]
     else:
@@ -47,9 +57,9 @@ def get_group(group_and_title) -> tuple[str | None, str]:
 
 
 def get_season_and_title(season_and_title) -> tuple[str, int]:
-    title = re.sub(r"([Ss]|Season )\d{1,3}", "", season_and_title).strip()
+    title = SEASON_SUB_RE.sub("", season_and_title).strip()
     try:
-        season = re.search(r"([Ss]|Season )(\d{1,3})", season_and_title, re.I).group(2)
+        season = SEASON_RE.search(season_and_title).group(2)
     except AttributeError:
         season = 1
     return title, int(season)
@@ -68,13 +78,26 @@ def torrent_parser(
     season: int | None = None,
     file_type: str = "media",
 ) -> EpisodeFile | SubtitleFile:
-    media_path = get_path_basename(torrent_path)
+    result = _cached_parser(torrent_path, torrent_name, season, file_type)
+    # Results are mutable models, never hand out the cached instance
+    return result.copy() if result else result
+
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
+def _cached_parser(
+    torrent_path: str,
+    torrent_name: str | None,
+    season: int | None,
+    file_type: str,
+) -> EpisodeFile | SubtitleFile:
+    path = Path(torrent_path)
+    media_path = path.name
     match_names = [torrent_name, media_path]
     if torrent_name is None:
         match_names = match_names[1:]
     for match_name in match_names:
-        for rule in RULES:
-            match_obj = re.match(rule, match_name, re.I)
+        for rule in RULES_RE:
+            match_obj = rule.match(match_name)
             if match_obj:
                 group, title = get_group(match_obj.group(1))
                 if not season:
@@ -82,7 +105,7 @@ def torrent_parser(
                 else:
                     title, _ = get_season_and_title(title)
                 episode = match_obj.group(2)
-                suffix = Path(torrent_path).suffix
+                suffix = path.suffix
                 if file_type == "media":
                     return EpisodeFile(
                         media_path=torrent_path,
@@ -0,0 +1,74 @@
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable
+
+from module.conf import settings
+from module.models import Episode, EpisodeFile, SubtitleFile
+from module.parser.analyser import raw_parser, torrent_parser
+
+logger = logging.getLogger(__name__)
+
+_pool: ProcessPoolExecutor | None = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def use_pool(size: int) -> bool:
+    workers = settings.program.parser_workers
+    return workers > 0 and size >= settings.program.parser_threshold
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool, _pool_workers
+    workers = settings.program.parser_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            # Forking while other threads hold locks (logging, sessions) can
+            # deadlock the child, start clean interpreters instead
+            _pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def pool_map(func: Callable, items: list) -> list:
+    """Run func over items in the parser processes, a few chunks per worker."""
+    pool = _get_pool()
+    chunksize = max(1, len(items) // (_pool_workers * 4))
+    logger.debug(f"[Parser] Parse {len(items)} items in {_pool_workers} processes.")
+    try:
+        return list(pool.map(func, items, chunksize=chunksize))
+    except BrokenProcessPool:
+        logger.warning("[Parser] Parser processes crashed, parse in place.")
+        shutdown_pool()
+        return [func(item) for item in items]
+
+
+def safe_raw_parser(raw: str) -> Episode | None:
+    try:
+        return raw_parser(raw)
+    except Exception:
+        return None
+
+
+def safe_torrent_parser(
+    job: tuple[str, str | None, int | None, str],
+) -> EpisodeFile | SubtitleFile | None:
+    try:
+        return torrent_parser(*job)
+    except Exception:
+        return None
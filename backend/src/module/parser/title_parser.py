@@ -1,7 +1,8 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from module.conf import settings
-from module.models import Bangumi
+from module.models import Bangumi, EpisodeFile, SubtitleFile
 from module.models.bangumi import Episode
 from module.parser.analyser import (
     OpenAIParser,
@@ -10,9 +11,17 @@ from module.parser.analyser import (
     tmdb_parser,
     torrent_parser,
 )
+from module.parser.pool import (
+    pool_map,
+    safe_raw_parser,
+    safe_torrent_parser,
+    use_pool,
+)
 
 logger = logging.getLogger(__name__)
 
+OPENAI_WORKERS = 4
+
 
 class TitleParser:
     def __init__(self):
@@ -30,6 +39,15 @@ class TitleParser:
         except Exception as e:
             logger.warning(f"Cannot parse {torrent_path} with error {e}")
 
+    @staticmethod
+    def torrent_parse_many(
+        jobs: list[tuple[str, str | None, int | None, str]],
+    ) -> list[EpisodeFile | SubtitleFile | None]:
+        """Parse (torrent_path, torrent_name, season, file_type) jobs in order."""
+        if use_pool(len(jobs)):
+            return pool_map(safe_torrent_parser, jobs)
+        return [TitleParser.torrent_parser(*job) for job in jobs]
+
     @staticmethod
     def tmdb_parser(title: str, season: int, language: str):
         tmdb_info = tmdb_parser(title, language)
@@ -56,52 +74,88 @@ class TitleParser:
 
     @staticmethod
     def raw_parser(raw: str) -> Bangumi | None:
+        return TitleParser.parse_many([raw])[0]
+
+    @staticmethod
+    def parse_many(titles: list[str]) -> list[Bangumi | None]:
+        """Parse each distinct title once, results follow the input order."""
+        unique = list(dict.fromkeys(titles))
         language = settings.rss_parser.language
-        try:
-            # use OpenAI ChatGPT to parse raw title and get structured data
-            if settings.experimental_openai.enable:
-                kwargs = settings.experimental_openai.dict(exclude={"enable"})
-                gpt = OpenAIParser(**kwargs)
-                episode_dict = gpt.parse(raw, asdict=True)
-                episode = Episode(**episode_dict)
-            else:
-                episode = raw_parser(raw)
-
-            titles = {
-                "zh": episode.title_zh,
-                "en": episode.title_en,
-                "jp": episode.title_jp,
-            }
-            title_raw = episode.title_en if episode.title_en else episode.title_zh
-            if titles[language]:
-                official_title = titles[language]
-            elif titles["zh"]:
-                official_title = titles["zh"]
-            elif titles["en"]:
-                official_title = titles["en"]
-            elif titles["jp"]:
-                official_title = titles["jp"]
-            else:
-                official_title = title_raw
-            _season = episode.season
-            logger.debug(f"RAW:{raw} >> {title_raw}")
-            return Bangumi(
-                official_title=official_title,
-                title_raw=title_raw,
-                season=_season,
-                season_raw=episode.season_raw,
-                group_name=episode.group,
-                dpi=episode.resolution,
-                source=episode.source,
-                subtitle=episode.sub,
-                eps_collect=False if episode.episode > 1 else True,
-                offset=0,
-                filter=",".join(settings.rss_parser.filter),
-            )
-        except Exception as e:
-            logger.debug(e)
-            logger.warning(f"Cannot parse {raw}.")
-            return None
+        _filter = ",".join(settings.rss_parser.filter)
+        openai_enable = settings.experimental_openai.enable
+        episodes = {}
+        if not openai_enable and use_pool(len(unique)):
+            episodes = dict(zip(unique, pool_map(safe_raw_parser, unique)))
+
+        def parse(raw: str, gpt: OpenAIParser | None = None) -> Bangumi | None:
+            try:
+                if gpt:
+                    # use OpenAI ChatGPT to parse raw title and get structured data
+                    episode = Episode(**gpt.parse(raw, asdict=True))
+                elif episodes:
+                    episode = episodes[raw]
+                else:
+                    episode = raw_parser(raw)
+                return TitleParser._to_bangumi(raw, episode, language, _filter)
+            except Exception as e:
+                logger.debug(e)
+                logger.warning(f"Cannot parse {raw}.")
+                return None
+
+        if openai_enable and unique:
+            kwargs = settings.experimental_openai.dict(exclude={"enable"})
+            gpt = OpenAIParser(**kwargs)
+            workers = min(OPENAI_WORKERS, len(unique))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = pool.map(lambda raw: parse(raw, gpt), unique)
+                parsed = dict(zip(unique, results))
+        else:
+            parsed = {raw: parse(raw) for raw in unique}
+
+        bangumis = []
+        seen = set()
+        for raw in titles:
+            bangumi = parsed[raw]
+            if bangumi and raw in seen:
+                # Callers modify the results, don't hand out the same object twice
+                bangumi = Bangumi(**bangumi.dict())
+            seen.add(raw)
+            bangumis.append(bangumi)
+        return bangumis
+
+    @staticmethod
+    def _to_bangumi(raw: str, episode: Episode, language: str, _filter: str) -> Bangumi:
+        titles = {
+            "zh": episode.title_zh,
+            "en": episode.title_en,
+            "jp": episode.title_jp,
+        }
+        title_raw = episode.title_en if episode.title_en else episode.title_zh
+        if titles[language]:
+            official_title = titles[language]
+        elif titles["zh"]:
+            official_title = titles["zh"]
+        elif titles["en"]:
+            official_title = titles["en"]
+        elif titles["jp"]:
+            official_title = titles["jp"]
+        else:
+            official_title = title_raw
+        _season = episode.season
+        logger.debug(f"RAW:{raw} >> {title_raw}")
+        return Bangumi(
+            official_title=official_title,
+            title_raw=title_raw,
+            season=_season,
+            season_raw=episode.season_raw,
+            group_name=episode.group,
+            dpi=episode.resolution,
+            source=episode.source,
+            subtitle=episode.sub,
+            eps_collect=False if episode.episode > 1 else True,
+            offset=0,
+            filter=_filter,
+        )
 
     @staticmethod
     def mikan_parser(homepage: str) -> tuple[str, str]:
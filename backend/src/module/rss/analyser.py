@@ -46,12 +46,19 @@ class RSSAnalyser(TitleParser):
         self, torrents: list[Torrent], rss: RSSItem, full_parse: bool = True
     ) -> list:
         new_data = []
-        for torrent in torrents:
-            bangumi = self.raw_parser(raw=torrent.name)
-            if bangumi and bangumi.title_raw not in [i.title_raw for i in new_data]:
+        titles = set()
+        names = [torrent.name for torrent in torrents]
+        if full_parse:
+            bangumis = self.parse_many(names)
+        else:
+            # Only the first parsable title is needed, parse lazily
+            bangumis = map(self.raw_parser, names)
+        for torrent, bangumi in zip(torrents, bangumis):
+            if bangumi and bangumi.title_raw not in titles:
                 self.official_title_parser(bangumi=bangumi, rss=rss, torrent=torrent)
                 if not full_parse:
                     return [bangumi]
+                titles.add(bangumi.title_raw)
                 new_data.append(bangumi)
                 logger.info(f"[RSS] New bangumi founded: {bangumi.official_title}")
         return new_data
@@ -63,22 +70,40 @@ class RSSAnalyser(TitleParser):
             bangumi.rss_link = rss.url
             return bangumi
 
+    @staticmethod
+    def get_new_torrents(
+        rss_link: str, engine: RSSEngine, full_parse: bool = True
+    ) -> list[Torrent]:
+        # Feeds are newest first, stop at the newest torrent of the last analysis.
+        # Torrents saved by refresh_rss may not have been analysed yet.
+        _filter = None if full_parse else "\\d+-\\d+"
+        marker = engine.rss.search_marker(rss_link)
+        rss_torrents = []
+        with RequestContent() as req:
+            for torrent in req.iter_torrents(rss_link, _filter):
+                if torrent.url == marker:
+                    break
+                rss_torrents.append(torrent)
+        return rss_torrents
+
     def rss_to_data(
         self, rss: RSSItem, engine: RSSEngine, full_parse: bool = True
     ) -> list[Bangumi]:
-        rss_torrents = self.get_rss_torrents(rss.url, full_parse)
+        rss_torrents = self.get_new_torrents(rss.url, engine, full_parse)
         torrents_to_add = engine.bangumi.match_list(rss_torrents, rss.url)
-        if not torrents_to_add:
-            logger.debug("[RSS] No new title has been found.")
-            return []
-        # New List
-        new_data = self.torrents_to_data(torrents_to_add, rss, full_parse)
+        new_data = []
+        if torrents_to_add:
+            # New List
+            new_data = self.torrents_to_data(torrents_to_add, rss, full_parse)
         if new_data:
             # Add to database
             engine.bangumi.add_all(new_data)
-            return new_data
         else:
-            return []
+            logger.debug("[RSS] No new title has been found.")
+        # Only move the marker once the torrents are handled, an error retries them
+        if rss_torrents:
+            engine.rss.update_marker(rss.url, rss_torrents[0].url)
+        return new_data
 
     def link_to_data(self, rss: RSSItem) -> Bangumi | ResponseModel:
         torrents = self.get_rss_torrents(rss.url, False)
@@ -1,11 +1,15 @@
 import logging
-import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
+from urllib.parse import urlparse
 
+from module.conf import settings
 from module.database import Database, engine
 from module.downloader import DownloadClient
-from module.models import Bangumi, ResponseModel, RSSItem, Torrent
+from module.models import Bangumi, ResponseModel, RSSItem, RSSValidator, Torrent
 from module.network import RequestContent
+from module.utils import compile_filter
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +28,38 @@ class RSSEngine(Database):
                 torrent.rss_id = rss.id
         return torrents
 
+    @staticmethod
+    def _fetch_all(
+        rss_items: list[RSSItem], validators: dict[str, RSSValidator] | None = None
+    ) -> list[Torrent]:
+        # Fetch all feeds in parallel, limit concurrent requests to the same host
+        if not rss_items:
+            return []
+        rss_urls = [rss.url for rss in rss_items]
+        host_limits = {
+            urlparse(url).netloc: threading.Semaphore(settings.rss_parser.host_limit)
+            for url in rss_urls
+        }
+        workers = max(1, min(settings.rss_parser.fetch_workers, len(rss_urls)))
+
+        def fetch(url: str) -> list[Torrent]:
+            validator = validators.get(url) if validators else None
+            with host_limits[urlparse(url).netloc]:
+                try:
+                    return req.get_torrents(url, validator=validator)
+                except Exception as e:
+                    logger.warning(f"[Engine] Failed to fetch {url}: {e}")
+                    return []
+
+        torrents = []
+        with RequestContent() as req, ThreadPoolExecutor(workers) as executor:
+            for rss, rss_torrents in zip(rss_items, executor.map(fetch, rss_urls)):
+                # Add RSS ID
+                for torrent in rss_torrents:
+                    torrent.rss_id = rss.id
+                torrents.extend(rss_torrents)
+        return torrents
+
     def get_rss_torrents(self, rss_id: int) -> list[Torrent]:
         rss = self.rss.search_id(rss_id)
         if rss:
@@ -38,16 +74,17 @@ class RSSEngine(Database):
         aggregate: bool = True,
         parser: str = "mikan",
     ):
-        if not name:
+        # An empty name means the title was already looked up and not found.
+        if name is None:
             with RequestContent() as req:
                 name = req.get_rss_title(rss_link)
-                if not name:
-                    return ResponseModel(
-                        status=False,
-                        status_code=406,
-                        msg_en="Failed to get RSS title.",
-                        msg_zh="无法获取 RSS 标题。",
-                    )
+        if not name:
+            return ResponseModel(
+                status=False,
+                status_code=406,
+                msg_en="Failed to get RSS title.",
+                msg_zh="无法获取 RSS 标题。",
+            )
         rss_data = RSSItem(name=name, url=rss_link, aggregate=aggregate, parser=parser)
         if self.rss.add(rss_data):
             return ResponseModel(
@@ -102,10 +139,8 @@ class RSSEngine(Database):
     def match_torrent(self, torrent: Torrent) -> Optional[Bangumi]:
         matched: Bangumi = self.bangumi.match_torrent(torrent.name)
         if matched:
-            if matched.filter == "":
-                return matched
-            _filter = matched.filter.replace(",", "|")
-            if not re.search(_filter, torrent.name, re.IGNORECASE):
+            pattern = compile_filter(bangumi_filter=matched.filter)
+            if pattern is None or not pattern.search(torrent.name):
                 torrent.bangumi_id = matched.id
                 return matched
         return None
@@ -117,19 +152,28 @@ class RSSEngine(Database):
         else:
             rss_item = self.rss.search_id(rss_id)
             rss_items = [rss_item] if rss_item else []
+        if not rss_items:
+            return
         # From RSS Items, get all torrents
         logger.debug(f"[Engine] Get {len(rss_items)} RSS items")
-        for rss_item in rss_items:
-            new_torrents = self.pull_rss(rss_item)
-            # Get all enabled bangumi data
-            for torrent in new_torrents:
-                matched_data = self.match_torrent(torrent)
-                if matched_data:
-                    if client.add_torrent(torrent, matched_data):
-                        logger.debug(f"[Engine] Add torrent {torrent.name} to client")
-                    torrent.downloaded = True
-            # Add all torrents to database
-            self.torrent.add_all(new_torrents)
+        validators = self.rss.search_validators([rss.url for rss in rss_items])
+        torrents = self._fetch_all(rss_items, validators)
+        new_torrents = self.torrent.check_new(torrents)
+        # Get all enabled bangumi data
+        matched: dict[int, tuple[Bangumi, list[Torrent]]] = {}
+        for torrent in new_torrents:
+            matched_data = self.match_torrent(torrent)
+            if matched_data:
+                matched.setdefault(matched_data.id, (matched_data, []))[1].append(
+                    torrent
+                )
+        # One request per bangumi, downloaded is set per torrent
+        for bangumi, torrents in matched.values():
+            for torrent in client.add_torrents(torrents, bangumi):
+                logger.debug(f"[Engine] Add torrent {torrent.name} to client")
+        # Add all torrents to database
+        self.torrent.add_all(new_torrents)
+        self.rss.update_validators(list(validators.values()))
 
     def download_bangumi(self, bangumi: Bangumi):
         with RequestContent() as req:
@@ -29,7 +29,7 @@ class SearchTorrent(RequestContent, RSSAnalyser):
         self, keywords: list[str], site: str = "mikan", limit: int = 5
     ) -> BangumiJSON:
         rss_item = search_url(site, keywords)
-        torrents = self.search_torrents(rss_item)
+        torrents = self.iter_torrents(rss_item.url)
         # yield for EventSourceResponse (Server Send)
         exist_list = []
         for torrent in torrents:
@@ -1,11 +1,16 @@
+import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 from urllib3.util import parse_url
 
+from module.conf import settings
 from module.rss import RSSEngine
 from module.utils import save_image
 from module.network import RequestContent
 
+logger = logging.getLogger(__name__)
+
 
 def from_30_to_31():
     with RSSEngine() as db:
@@ -33,14 +38,34 @@ def from_30_to_31():
 
 
 def cache_image():
-    with RSSEngine() as db, RequestContent() as req:
+    with RSSEngine() as db:
         bangumis = db.bangumi.search_all()
+        # Posters already in the local store need no download
+        urls = list(
+            {
+                bangumi.poster_link
+                for bangumi in bangumis
+                if bangumi.poster_link and "://" in bangumi.poster_link
+            }
+        )
+        if not urls:
+            return
+        # No more threads than connections in the shared session pool
+        workers = settings.rss_parser.host_limit
+        with RequestContent() as req, ThreadPoolExecutor(workers) as pool:
+            images = dict(zip(urls, pool.map(req.get_content, urls)))
+        img_paths = {}
+        for url, img in images.items():
+            if img is None:
+                logger.warning(f"[Update] Cannot download poster {url}")
+                continue
+            # Hash local path
+            img_paths[url] = save_image(img, url.split(".")[-1])
+        updated = []
         for bangumi in bangumis:
-            if bangumi.poster_link:
-                # Hash local path
-                img = req.get_content(bangumi.poster_link)
-                suffix = bangumi.poster_link.split(".")[-1]
-                img_path = save_image(img, suffix)
-                bangumi.poster_link = img_path
-        db.bangumi.update_all(bangumis)
-
+            if bangumi.poster_link in img_paths:
+                bangumi.poster_link = img_paths[bangumi.poster_link]
+                updated.append(bangumi)
+        if updated:
+            db.bangumi.update_all(updated)
+        logger.info(f"[Update] Cached {len(img_paths)} of {len(urls)} posters.")
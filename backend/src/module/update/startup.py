@@ -10,6 +10,7 @@ def start_up():
     with RSSEngine() as engine:
         engine.create_table()
         engine.user.add_default_user()
+        engine.bangumi.rebuild_rss()
 
 
 def first_run():
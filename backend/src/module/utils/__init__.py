@@ -1 +1,5 @@
-from .cache_image import save_image, load_image
\ No newline at end of file
+from .bencode import info_hash, magnet_hash
+from .cache_image import load_image, poster_file, save_image
+from .retry import RetryPolicy, host_breaker
+from .title_matcher import TitleMatcher
+from .torrent_filter import compile_filter
@@ -0,0 +1,52 @@
+import base64
+import hashlib
+import re
+
+BTIH_RE = re.compile(r"urn:btih:([0-9a-zA-Z]+)")
+
+
+def _skip(data: bytes, i: int) -> int:
+    # Returns the index right after the bencoded value starting at i
+    c = data[i : i + 1]
+    if c == b"i":
+        return data.index(b"e", i) + 1
+    if c in (b"l", b"d"):
+        i += 1
+        while data[i : i + 1] != b"e":
+            i = _skip(data, i)
+        return i + 1
+    colon = data.index(b":", i)
+    return colon + 1 + int(data[i:colon])
+
+
+def info_hash(content: bytes | None) -> str | None:
+    """SHA-1 infohash of a .torrent file, the same hash qBittorrent reports."""
+    if not content or content[:1] != b"d":
+        return None
+    try:
+        i = 1
+        while content[i : i + 1] != b"e":
+            key_end = _skip(content, i)
+            value_end = _skip(content, key_end)
+            if content[content.index(b":", i) + 1 : key_end] == b"info":
+                return hashlib.sha1(content[key_end:value_end]).hexdigest()
+            i = value_end
+    except (ValueError, IndexError, RecursionError):
+        pass
+    return None
+
+
+def magnet_hash(url: str) -> str | None:
+    """Infohash of a magnet link, hex or base32 encoded."""
+    match = BTIH_RE.search(url)
+    if match is None:
+        return None
+    btih = match.group(1)
+    if len(btih) == 40:
+        return btih.lower()
+    if len(btih) == 32:
+        try:
+            return base64.b32decode(btih.upper()).hex()
+        except ValueError:
+            return None
+    return None
@@ -1,11 +1,23 @@
 import hashlib
+import os
+import threading
+from pathlib import Path
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Widths requested by the WebUI, poster cards at 2x and search results
+THUMBNAIL_WIDTHS = (150, 300)
 
 
 def save_image(img, suffix):
-    img_hash = hashlib.md5(img).hexdigest()[0:8]
-    image_path = f"data/posters/{img_hash}.{suffix}"
-    with open(image_path, "wb") as f:
-        f.write(img)
+    # Content-addressed, an existing file already holds the same image
+    img_hash = hashlib.md5(img).hexdigest()
+    image_path = Path(f"data/posters/{img_hash}.{suffix}")
+    if not image_path.exists():
+        image_path.write_bytes(img)
     return f"posters/{img_hash}.{suffix}"
 
 
@@ -15,3 +27,24 @@ def load_image(img_path):
             return f.read()
     else:
         return None
+
+
+def poster_file(img_path: str, width: int | None = None) -> str:
+    """File to serve for a poster, a WebP thumbnail if Pillow is installed."""
+    source = Path(f"data/posters/{img_path}")
+    if width not in THUMBNAIL_WIDTHS or Image is None or not source.is_file():
+        return str(source)
+    thumb = Path(f"data/posters/thumbs/{source.stem}_{width}.webp")
+    if thumb.exists():
+        return str(thumb)
+    tmp = thumb.with_name(f"{thumb.name}.{threading.get_ident()}")
+    try:
+        thumb.parent.mkdir(exist_ok=True)
+        with Image.open(source) as img:
+            img.thumbnail((width, width * 3))
+            img.save(tmp, "WEBP", quality=80)
+        os.replace(tmp, thumb)
+    except (OSError, ValueError):
+        tmp.unlink(missing_ok=True)
+        return str(source)
+    return str(thumb)
@@ -0,0 +1,77 @@
+import random
+import threading
+import time
+from typing import Iterator
+
+
+class RetryPolicy:
+    """
+    Iterate over attempts, sleeping with exponential backoff and jitter in between.
+
+    Iteration stops after `attempts` tries, or earlier if the next wait would
+    exceed the total `deadline` in seconds.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        base_delay: float = 1,
+        max_delay: float = 10,
+        deadline: float = 30,
+        jitter: float = 0.5,
+    ):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.jitter = jitter
+
+    def backoff(self, attempt: int) -> float:
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return delay * random.uniform(1 - self.jitter, 1)
+
+    def __iter__(self) -> Iterator[int]:
+        start = time.monotonic()
+        for attempt in range(self.attempts):
+            if attempt:
+                delay = self.backoff(attempt)
+                if time.monotonic() - start + delay > self.deadline:
+                    return
+                time.sleep(delay)
+            yield attempt
+
+
+class CircuitBreaker:
+    """
+    Stop calling a host after `threshold` consecutive failures.
+
+    Once `cooldown` seconds have passed, calls are let through again and the
+    next failure opens the circuit right away.
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 300):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures: dict[str, int] = {}
+        self._opened: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, key: str) -> bool:
+        with self._lock:
+            opened = self._opened.get(key)
+            return opened is None or time.monotonic() - opened >= self.cooldown
+
+    def success(self, key: str):
+        with self._lock:
+            self._failures.pop(key, None)
+            self._opened.pop(key, None)
+
+    def failure(self, key: str):
+        with self._lock:
+            failures = self._failures.get(key, 0) + 1
+            self._failures[key] = failures
+            if failures >= self.threshold:
+                self._opened[key] = time.monotonic()
+
+
+host_breaker = CircuitBreaker()
@@ -0,0 +1,25 @@
+import re
+from functools import lru_cache
+
+FILTER_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def compile_filter(
+    global_filter: str = "", bangumi_filter: str = ""
+) -> re.Pattern | None:
+    """
+    Compile exclusion filters into one regex, so a torrent name is checked in one pass.
+
+    :param global_filter: `|` joined filter, matched case-sensitively like `rss_parser.filter`.
+    :param bangumi_filter: Comma separated `Bangumi.filter`, matched case-insensitively.
+    :return: The compiled pattern, or None if there is nothing to exclude.
+    """
+    parts = []
+    if global_filter:
+        parts.append(f"(?:{global_filter})")
+    if bangumi_filter:
+        parts.append(f"(?i:{bangumi_filter.replace(',', '|')})")
+    if not parts:
+        return None
+    return re.compile("|".join(parts))
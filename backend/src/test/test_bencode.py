@@ -0,0 +1,19 @@
+import hashlib
+
+from module.utils import info_hash, magnet_hash
+
+
+def test_info_hash():
+    info = b"d6:lengthi10e4:name3:abc12:piece lengthi16384e6:pieces20:" + b"x" * 20
+    info += b"e"
+    content = b"d8:announce15:http://tracker/4:info" + info + b"7:privatei1ee"
+    assert info_hash(content) == hashlib.sha1(info).hexdigest()
+    assert info_hash(b"<html>not a torrent</html>") is None
+    assert info_hash(b"d4:info") is None
+
+
+def test_magnet_hash():
+    hex_hash = "c12fe1c06bba254a9dc9f519b335aa7c1367a88a"
+    assert magnet_hash(f"magnet:?xt=urn:btih:{hex_hash.upper()}&dn=a") == hex_hash
+    assert magnet_hash("magnet:?xt=urn:btih:YEX6DQDLXISUVHOJ6UM3GNNKPQJWPKEK") == hex_hash
+    assert magnet_hash("https://mikanani.me/a.torrent") is None
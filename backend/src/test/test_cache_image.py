@@ -0,0 +1,57 @@
+import hashlib
+import io
+
+import pytest
+from PIL import Image
+
+from module.utils import cache_image, poster_file, save_image
+
+
+@pytest.fixture
+def posters(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "data" / "posters"
+    path.mkdir(parents=True)
+    return path
+
+
+def make_poster(color: str) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (780, 1170), color).save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+def test_save_image(posters):
+    img = make_poster("red")
+    img_path = save_image(img, "jpg")
+    assert img_path == f"posters/{hashlib.md5(img).hexdigest()}.jpg"
+    assert (posters.parent / img_path).read_bytes() == img
+    # Same content, same file
+    assert save_image(img, "jpg") == img_path
+    assert save_image(make_poster("blue"), "jpg") != img_path
+
+
+def test_poster_file(posters):
+    img_path = save_image(make_poster("red"), "jpg")
+    name = img_path.removeprefix("posters/")
+    for width in cache_image.THUMBNAIL_WIDTHS:
+        thumb = poster_file(name, width)
+        assert thumb.endswith(f"_{width}.webp")
+        with Image.open(thumb) as img:
+            assert img.format == "WEBP"
+            assert img.size == (width, width * 3 // 2)
+    # Other widths and missing files are served as they are
+    assert poster_file(name, 123) == f"data/{img_path}"
+    assert poster_file(name) == f"data/{img_path}"
+    assert poster_file("missing.jpg", 300) == "data/posters/missing.jpg"
+
+
+def test_poster_headers(posters):
+    # main writes its config and log relative to the working directory
+    (posters.parent.parent / "config").mkdir()
+    import main
+
+    name = save_image(make_poster("red"), "jpg").removeprefix("posters/")
+    resp = main.posters(name, 300)
+    assert resp.path.endswith("_300.webp")
+    assert resp.headers["cache-control"] == "public, max-age=31536000, immutable"
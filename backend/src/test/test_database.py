@@ -1,5 +1,5 @@
 from module.database.combine import Database
-from module.models import Bangumi, RSSItem, Torrent
+from module.models import Bangumi, RenameState, RSSItem, Torrent
 from sqlmodel import SQLModel, create_engine
 from sqlmodel.pool import StaticPool
 
@@ -50,6 +50,19 @@ def test_bangumi_database():
         )
         assert result.official_title == "无职转生，到了异世界就拿出真本事II"
 
+        # match list
+        torrents = [
+            Torrent(name="[Lilith-Raws] Mushoku Tensei - 12 [1080p]"),
+            Torrent(name="[Lilith-Raws] Otonari no Tenshi-sama - 09 [1080p]"),
+        ]
+        result = db.bangumi.match_list(torrents, "test2")
+        assert [t.name for t in result] == [torrents[1].name]
+        assert db.bangumi.search_id(1).rss_link == "test,test2"
+
+        # disabled bangumi do not match torrents
+        db.bangumi.disable_rule(1)
+        assert db.bangumi.match_torrent(torrents[0].name) is None
+
         # delete
         db.bangumi.delete_one(1)
         assert db.bangumi.search_id(1) is None
@@ -70,9 +83,108 @@ def test_torrent_database():
         db.torrent.update(test_data)
         assert db.torrent.search(1) == test_data
 
+        # check new
+        new_data = Torrent(
+            name="[Sub Group]test S02 02 [720p].mkv",
+            url="https://test.com/test2.mkv",
+        )
+        new_torrents = db.torrent.check_new([test_data, new_data, new_data])
+        assert new_torrents == [new_data]
+
 
 def test_rss_database():
     rss_url = "https://test.com/test.xml"
 
     with Database(engine) as db:
         db.rss.add(RSSItem(url=rss_url))
+
+        # validators
+        validators = db.rss.search_validators([rss_url])
+        assert validators[rss_url].etag is None
+        validators[rss_url].etag = '"abc"'
+        db.rss.update_validators(list(validators.values()))
+        assert db.rss.search_validators([rss_url])[rss_url].etag == '"abc"'
+
+
+def test_cache_database():
+    with Database(engine) as db:
+        db.cache.set("tmdb:search:a", {"results": [1]}, max_size=2)
+        assert db.cache.get("tmdb:search:a", ttl=60) == {"results": [1]}
+        assert db.cache.get("tmdb:search:a", ttl=-1) is None
+        assert db.cache.get("tmdb:search:b", ttl=60) is None
+
+        # evict the oldest
+        db.cache.set("tmdb:search:b", {"results": []}, max_size=2)
+        db.cache.set("tmdb:info:1:zh", {"genres": []}, max_size=2)
+        assert db.cache.get("tmdb:search:a", ttl=60) is None
+        assert db.cache.get("tmdb:info:1:zh", ttl=60) == {"genres": []}
+
+
+def test_rename_database():
+    with Database(engine) as db:
+        db.rename.add_all(
+            [
+                RenameState(hash="a" * 40, fingerprint="1", rename_method="pn"),
+                RenameState(hash="b" * 40, fingerprint="2", rename_method="pn"),
+            ]
+        )
+        db.rename.add_all(
+            [RenameState(hash="a" * 40, fingerprint="3", rename_method="advance")]
+        )
+        states = db.rename.search_all()
+        assert states["a" * 40].fingerprint == "3"
+        assert states["a" * 40].rename_method == "advance"
+
+        db.rename.delete_hashes(["b" * 40])
+        assert list(db.rename.search_all()) == ["a" * 40]
+
+
+def test_bangumi_batch():
+    with Database(engine) as db:
+        db.bangumi.add_all(
+            [
+                Bangumi(official_title="A", title_raw="Batch A", rss_link="r1"),
+                Bangumi(official_title="B", title_raw="Batch B", rss_link="r1,r2"),
+            ]
+        )
+        a, b = (db.bangumi.match_torrent(f"[Group] Batch {x} - 01").id for x in "AB")
+        torrents = [
+            Torrent(name="[Group] Batch A - 02"),
+            Torrent(name="[Group] Batch B - 02"),
+        ]
+        with db.bangumi.batch():
+            db.bangumi.disable_rule(a)
+            db.bangumi.update_poster("Batch B", "posters/b.jpg")
+            assert db.bangumi.match_list(torrents, "r2") == []
+            # Nothing is written before the batch ends
+            assert db.bangumi.search_id(a).deleted is False
+        assert db.bangumi.search_id(a).deleted is True
+        assert db.bangumi.search_id(a).rss_link == "r1,r2"
+        assert db.bangumi.search_id(b).rss_link == "r1,r2"
+        assert db.bangumi.search_id(b).poster_link == "posters/b.jpg"
+
+        # rss links are kept in bangumi_rss for joins
+        assert sorted(x.id for x in db.bangumi.search_rss("r2")) == sorted([a, b])
+        db.bangumi.update_rss("Batch A", "r3")
+        assert [x.id for x in db.bangumi.search_rss("r3")] == [a]
+        assert [x.id for x in db.bangumi.search_rss("r2")] == [b]
+        db.bangumi.delete_one(b)
+        assert db.bangumi.search_rss("r2") == []
+
+
+def test_bangumi_match_list_rss_prefix():
+    with Database(engine) as db:
+        db.bangumi.add(
+            Bangumi(
+                official_title="P", title_raw="Prefix P", rss_link="https://x/?id=12"
+            )
+        )
+        _id = db.bangumi.match_torrent("[Group] Prefix P - 01").id
+        torrents = [Torrent(name="[Group] Prefix P - 02")]
+        assert db.bangumi.match_list(torrents, "https://x/?id=1") == []
+        bangumi = db.bangumi.search_id(_id)
+        assert bangumi.rss_link == "https://x/?id=12,https://x/?id=1"
+        assert [x.id for x in db.bangumi.search_rss("https://x/?id=1")] == [_id]
+        # A feed already linked is not appended twice
+        db.bangumi.match_list(torrents, "https://x/?id=1")
+        assert db.bangumi.search_id(_id).rss_link == bangumi.rss_link
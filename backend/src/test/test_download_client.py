@@ -0,0 +1,60 @@
+from module.downloader import DownloadClient
+from module.models import Bangumi, Torrent
+from module.utils import info_hash, magnet_hash
+
+
+class FakeQb:
+    def __init__(self, existing, rejected=()):
+        self.existing = set(existing)
+        self.rejected = set(rejected)
+        self.submitted = None
+
+    def torrents_info(self, status_filter, category, tag=None, hashes=None):
+        return [
+            type("Info", (), {"hash": h})
+            for h in hashes.split("|")
+            if h in self.existing
+        ]
+
+    def add_torrents(self, torrent_urls, torrent_files, save_path, category):
+        self.submitted = (torrent_urls, torrent_files)
+        hashes = [magnet_hash(url) for url in torrent_urls or []]
+        hashes += [info_hash(file) for file in torrent_files or []]
+        accepted = {h for h in hashes if h and h not in self.rejected}
+        self.existing |= accepted
+        # Like qBittorrent, one accepted torrent makes the whole call succeed
+        return bool(accepted)
+
+
+def test_add_torrents(monkeypatch):
+    old = b"d4:infod4:name3:olde8:announce0:e"
+    new = b"d4:infod4:name3:newee"
+    files = {
+        "https://test.com/old.torrent": old,
+        "https://test.com/new.torrent": new,
+        "https://test.com/error.torrent": b"<html>502 Bad Gateway</html>",
+        "https://test.com/timeout.torrent": None,
+    }
+    client = DownloadClient.__new__(DownloadClient)
+    client.client = FakeQb([info_hash(old)])
+    monkeypatch.setattr(client, "_fetch_torrents", lambda urls: files)
+    torrents = [Torrent(name=url, url=url) for url in files]
+    bangumi = Bangumi(official_title="Test", save_path="/downloads/Test")
+    added = client.add_torrents(torrents, bangumi)
+    assert [t.url for t in added] == ["https://test.com/new.torrent"]
+    assert client.client.submitted == (None, [new])
+    assert [t.downloaded for t in torrents] == [True, True, False, False]
+
+
+def test_add_torrents_partial_failure(monkeypatch):
+    good = b"d4:infod4:name4:goodee"
+    bad = b"d4:infod4:name3:badee"
+    files = {"https://test.com/good.torrent": good, "https://test.com/bad.torrent": bad}
+    client = DownloadClient.__new__(DownloadClient)
+    client.client = FakeQb([], rejected=[info_hash(bad)])
+    monkeypatch.setattr(client, "_fetch_torrents", lambda urls: files)
+    torrents = [Torrent(name=url, url=url) for url in files]
+    bangumi = Bangumi(official_title="Test", save_path="/downloads/Test")
+    added = client.add_torrents(torrents, bangumi)
+    assert [t.url for t in added] == ["https://test.com/good.torrent"]
+    assert [t.downloaded for t in torrents] == [True, False]
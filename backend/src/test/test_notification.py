@@ -0,0 +1,30 @@
+from module.models import Notification
+from module.notification.dispatcher import NotificationDispatcher, digest
+
+
+def test_digest():
+    notifications = [
+        Notification(official_title="Title", season=1, episode=3),
+        Notification(official_title="Other", season=2, episode=1),
+        Notification(official_title="Title", season=1, episode=2),
+        Notification(official_title="Title", season=1, episode=3),
+    ]
+    digests = digest(notifications)
+    assert [(n.official_title, n.episode) for n in digests] == [
+        ("Title", "2, 3"),
+        ("Other", 1),
+    ]
+
+
+def test_dispatch_error_keeps_batch(monkeypatch):
+    dispatcher = NotificationDispatcher()
+    kept = []
+
+    def fail(notifications):
+        raise TypeError("unsupported notification type")
+
+    monkeypatch.setattr(dispatcher, "_dispatch", fail)
+    monkeypatch.setattr(dispatcher, "_keep", kept.extend)
+    notify = Notification(official_title="Title", season=1, episode=1)
+    dispatcher._safe_dispatch([notify])
+    assert kept == [notify]
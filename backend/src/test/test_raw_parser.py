@@ -109,3 +109,21 @@ def test_raw_parser():
 
 
 
+
+    # Group names are matched literally
+    content = "[Lilith+Raws] Kage no Jitsuryokusha ni Naritakute! S02 - 01 [Baha][WEB-DL][1080p][AVC AAC][CHT][MP4]"
+    info = raw_parser(content)
+    assert info.group == "Lilith+Raws"
+    assert info.title_en == "Kage no Jitsuryokusha ni Naritakute!"
+    assert info.season == 2
+    assert info.episode == 1
+
+
+def test_raw_parser_cache():
+    raw_parser.cache_clear()
+    content = "[Lilith-Raws] Boku no Kokoro no Yabai Yatsu - 01 [Baha][WEB-DL][1080p][AVC AAC][CHT][MP4]"
+    info = raw_parser(content)
+    assert raw_parser(f" {content}\n") is info
+    cache_info = raw_parser.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 1
@@ -0,0 +1,25 @@
+from module.utils.retry import CircuitBreaker, RetryPolicy
+
+
+def test_retry_policy():
+    assert list(RetryPolicy(attempts=3, base_delay=0)) == [0, 1, 2]
+    # The second wait alone would pass the deadline
+    policy = RetryPolicy(attempts=5, base_delay=1, jitter=0, deadline=0.5)
+    assert list(policy) == [0]
+    policy = RetryPolicy(base_delay=2, max_delay=5, jitter=0)
+    assert [policy.backoff(i) for i in range(1, 5)] == [2, 4, 5, 5]
+
+
+def test_circuit_breaker():
+    breaker = CircuitBreaker(threshold=2, cooldown=60)
+    breaker.failure("mikanani.me")
+    assert breaker.allow("mikanani.me")
+    breaker.failure("mikanani.me")
+    assert not breaker.allow("mikanani.me")
+    assert breaker.allow("nyaa.si")
+    breaker.success("mikanani.me")
+    assert breaker.allow("mikanani.me")
+    breaker.cooldown = 0
+    breaker.failure("nyaa.si")
+    breaker.failure("nyaa.si")
+    assert breaker.allow("nyaa.si")
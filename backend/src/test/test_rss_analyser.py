@@ -0,0 +1,47 @@
+import io
+
+from module.models import RSSItem, Torrent
+from module.network import RequestContent
+from module.rss import RSSAnalyser, RSSEngine
+
+from .test_database import engine as e
+
+RSS = """<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0">
+  <channel>
+    <title>Aggregate</title>
+    <item>
+      <title>[Analyser] Marker Test - 02 [1080p]</title>
+      <link>https://test.com/Episode/02</link>
+      <enclosure type="application/x-bittorrent" url="https://test.com/02.torrent" />
+    </item>
+    <item>
+      <title>[Analyser] Marker Test - 01 [1080p]</title>
+      <link>https://test.com/Episode/01</link>
+      <enclosure type="application/x-bittorrent" url="https://test.com/01.torrent" />
+    </item>
+  </channel>
+</rss>
+""".encode()
+
+
+def test_rss_to_data_after_refresh(monkeypatch):
+    monkeypatch.setattr(
+        RequestContent,
+        "iter_torrents",
+        lambda self, url, _filter=None: self._parse_torrents(io.BytesIO(RSS), _filter),
+    )
+    rss = RSSItem(url="https://test.com/rss", parser="none")
+    with RSSEngine(e) as engine:
+        engine.create_table()
+        # refresh_rss saved the torrents before the feed was ever analysed
+        engine.torrent.add_all(
+            [
+                Torrent(name="02", url="https://test.com/02.torrent"),
+                Torrent(name="01", url="https://test.com/01.torrent"),
+            ]
+        )
+        new_data = RSSAnalyser().rss_to_data(rss, engine)
+        assert [b.title_raw for b in new_data] == ["Marker Test"]
+        assert engine.rss.search_marker(rss.url) == "https://test.com/02.torrent"
+        assert RSSAnalyser().get_new_torrents(rss.url, engine) == []
@@ -0,0 +1,87 @@
+import io
+
+from requests import Response
+from module.models import RSSValidator
+from module.network import RequestContent
+
+RSS = """<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0">
+  <channel>
+    <title>Mikan Project - 无职转生～到了异世界就拿出真本事～</title>
+    <item>
+      <title>[Lilith-Raws] Mushoku Tensei - 12 [Baha][WEB-DL][1080p][AVC AAC][CHT][MP4]</title>
+      <link>https://mikanani.me/Home/Episode/12</link>
+      <torrent xmlns="https://mikanani.me/0.1/"><contentLength>1</contentLength></torrent>
+      <enclosure type="application/x-bittorrent" length="1" url="https://mikanani.me/Download/12.torrent" />
+    </item>
+    <item>
+      <title>[Lilith-Raws] Mushoku Tensei - 11 [Baha][WEB-DL][720p][AVC AAC][CHT][MP4]</title>
+      <link>https://mikanani.me/Home/Episode/11</link>
+      <enclosure type="application/x-bittorrent" length="1" url="https://mikanani.me/Download/11.torrent" />
+    </item>
+    <item>
+      <title>[Lilith-Raws] Mushoku Tensei - 10 [Baha][WEB-DL][1080p][AVC AAC][CHT][MP4]</title>
+      <link>magnet:?xt=urn:btih:10</link>
+    </item>
+  </channel>
+</rss>
+""".encode()
+
+
+def test_parse_torrents():
+    torrents = list(RequestContent._parse_torrents(io.BytesIO(RSS), "720"))
+    assert [t.url for t in torrents] == [
+        "https://mikanani.me/Download/12.torrent",
+        "magnet:?xt=urn:btih:10",
+    ]
+    assert torrents[0].homepage == "https://mikanani.me/Home/Episode/12"
+    assert torrents[1].homepage == ""
+
+    torrents = list(RequestContent._parse_torrents(io.BytesIO(RSS), "", limit=2))
+    assert len(torrents) == 2
+
+
+def make_response(status_code: int, content: bytes = b"", **headers) -> Response:
+    resp = Response()
+    resp.status_code = status_code
+    resp._content = content
+    resp.headers.update(headers)
+    return resp
+
+
+def test_get_torrents_conditional(monkeypatch):
+    url = "https://mikanani.me/RSS/Bangumi"
+    sent = []
+    responses = []
+    req = RequestContent()
+
+    def get_url(_url, retry=3, headers=None, stream=False):
+        sent.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setattr(req, "get_url", get_url)
+    validator = RSSValidator(url=url)
+
+    # First fetch parses the feed and keeps its validators
+    responses.append(make_response(200, RSS, ETag='"v1"'))
+    assert len(req.get_torrents(url, "", validator=validator)) == 3
+    assert sent[-1] == {}
+    assert validator.etag == '"v1"'
+
+    # 304 means nothing changed, validators are sent back
+    responses.append(make_response(304))
+    assert req.get_torrents(url, "", validator=validator) == []
+    assert sent[-1] == {"If-None-Match": '"v1"'}
+
+    # Servers without validators fall back to the body hash
+    responses.append(
+        make_response(200, RSS, **{"Last-Modified": "Sat, 17 Oct 2026 00:00:00 GMT"})
+    )
+    assert req.get_torrents(url, "", validator=validator) == []
+    assert validator.etag is None
+
+    changed = RSS.replace(b"Mushoku Tensei - 12", b"Mushoku Tensei - 13")
+    responses.append(make_response(200, changed))
+    torrents = req.get_torrents(url, "", validator=validator)
+    assert sent[-1] == {"If-Modified-Since": "Sat, 17 Oct 2026 00:00:00 GMT"}
+    assert torrents[0].name.startswith("[Lilith-Raws] Mushoku Tensei - 13")
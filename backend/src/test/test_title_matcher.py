@@ -0,0 +1,14 @@
+from module.utils import TitleMatcher
+
+
+def test_title_matcher():
+    matcher = TitleMatcher(["Mushoku Tensei", "Tensei", "he", "she", "hers"])
+    assert matcher.search("[Lilith-Raws] Mushoku Tensei - 11") == {
+        "Mushoku Tensei",
+        "Tensei",
+    }
+    assert matcher.search("ushers") == {"he", "she", "hers"}
+    assert matcher.search("Otonari no Tenshi-sama") == set()
+
+    matcher = TitleMatcher(["", "abc"])
+    assert matcher.search("xyz") == {""}
@@ -1,5 +1,10 @@
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 from module.conf import settings
+from module.parser.pool import shutdown_pool
 from module.parser.title_parser import TitleParser
 
 
@@ -25,3 +30,83 @@ class TestTitleParser:
         assert result.dpi == "1080P"
         assert result.season == 1
         assert result.subtitle == "GB_JP"
+
+    def test_parse_many(self):
+        titles = [
+            "[梦蓝字幕组]New Doraemon 哆啦A梦新番[747][2023.02.25][AVC][1080P][GB_JP][MP4]",
+            "[Lilith-Raws] 关于我在无意间被隔壁的天使变成废柴这件事 / Otonari no Tenshi-sama - 09 [Baha][WEB-DL][1080p][AVC AAC][CHT][MP4]",
+            "[梦蓝字幕组]New Doraemon 哆啦A梦新番[747][2023.02.25][AVC][1080P][GB_JP][MP4]",
+        ]
+        results = TitleParser.parse_many(titles)
+        assert [r.title_raw for r in results] == [
+            "New Doraemon",
+            "Otonari no Tenshi-sama",
+            "New Doraemon",
+        ]
+        assert results[0] is not results[2]
+
+    def test_parse_many_in_processes(self):
+        titles = [
+            "[梦蓝字幕组]New Doraemon 哆啦A梦新番[747][2023.02.25][AVC][1080P][GB_JP][MP4]",
+            "[Lilith-Raws] 关于我在无意间被隔壁的天使变成废柴这件事 / Otonari no Tenshi-sama - 09 [Baha][WEB-DL][1080p][AVC AAC][CHT][MP4]",
+            "not a title",
+        ]
+        jobs = [
+            (
+                "/Bangumi/Season 1/[Lilith-Raws] Otonari no Tenshi-sama - 09.mp4",
+                None,
+                1,
+                "media",
+            ),
+            ("/Bangumi/Season 2/[ANi] Title S2 - 03 [CHT].srt", None, None, "subtitle"),
+        ]
+        serial = TitleParser.parse_many(titles), TitleParser.torrent_parse_many(jobs)
+        workers, threshold = (
+            settings.program.parser_workers,
+            settings.program.parser_threshold,
+        )
+        settings.program.parser_workers, settings.program.parser_threshold = 2, 1
+        try:
+            pooled = TitleParser.parse_many(titles), TitleParser.torrent_parse_many(
+                jobs
+            )
+        finally:
+            settings.program.parser_workers = workers
+            settings.program.parser_threshold = threshold
+            shutdown_pool()
+        assert pooled == serial
+        assert pooled[0][2] is None
+        assert pooled[1][1].season == 2
+        assert pooled[1][1].language == "zh-tw"
+
+
+SERVER = """
+import logging, runpy, sys
+import uvicorn
+
+def serve(app, **kwargs):
+    from module.conf import settings
+    from module.parser.pool import shutdown_pool
+    from module.parser.title_parser import TitleParser
+
+    settings.program.parser_workers, settings.program.parser_threshold = 2, 1
+    TitleParser.parse_many(["[Lilith-Raws] Otonari no Tenshi-sama - 09 [1080p]"])
+    shutdown_pool()
+    logging.getLogger("main").warning("after pool")
+
+uvicorn.run = serve
+sys.path.insert(0, {src!r})
+runpy.run_path({main!r}, run_name="__main__")
+"""
+
+
+def test_parse_many_keeps_server_log(tmp_path):
+    # Spawned parser processes import main.py again as __mp_main__
+    src = Path(__file__).parents[1]
+    (tmp_path / "config").mkdir()
+    log = tmp_path / "data" / "log.txt"
+    script = SERVER.format(src=str(src), main=str(src / "main.py"))
+    subprocess.run(
+        [sys.executable, "-c", script], cwd=tmp_path, check=True, timeout=300
+    )
+    assert "after pool" in log.read_text(encoding="utf-8")
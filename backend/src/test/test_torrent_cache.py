@@ -0,0 +1,30 @@
+import os
+
+from module.conf import settings
+from module.downloader.torrent_cache import TorrentCache
+from module.utils import info_hash
+
+
+def make_torrent(name: bytes) -> bytes:
+    info = b"d4:name%d:%s6:pieces20:%se" % (len(name), name, b"x" * 20)
+    return b"d4:info" + info + b"e"
+
+
+def test_torrent_cache(tmp_path):
+    cache_size = settings.downloader.torrent_cache_size
+    settings.downloader.torrent_cache_size = 1
+    try:
+        cache = TorrentCache(tmp_path)
+        a, b = make_torrent(b"a"), make_torrent(b"b" * 600_000)
+        cache.put_many({"http://a": a, "http://a2": a, "http://bad": b"<html>"})
+        assert len(list(tmp_path.glob("*.torrent"))) == 1
+        # A fresh instance reads the index from disk
+        cache = TorrentCache(tmp_path)
+        assert cache.get_many(["http://a2", "http://bad"]) == {"http://a2": a}
+        # Over 1 MB the least recently used file goes first
+        os.utime(tmp_path / f"{info_hash(a)}.torrent", (0, 0))
+        cache.put_many({"http://b": b})
+        cache.put_many({"http://c": make_torrent(b"c" * 600_000)})
+        assert cache.get_many(["http://a", "http://b"]) == {}
+    finally:
+        settings.downloader.torrent_cache_size = cache_size
@@ -0,0 +1,15 @@
+from module.utils import compile_filter
+
+
+def test_compile_filter():
+    title = "[Lilith-Raws] Mushoku Tensei - 11 [Baha][WEB-DL][720P][AVC AAC][CHT][MP4]"
+    assert compile_filter("720|\\d+-\\d+").search(title)
+    assert compile_filter("720p").search(title) is None
+    assert compile_filter(bangumi_filter="720p,\\d+-\\d+").search(title)
+    assert compile_filter("", "") is None
+
+    pattern = compile_filter("CHS", "720p")
+    assert pattern.search(title)
+    assert pattern.search("[Sub] Title - 01 [1080P][CHS]")
+    assert pattern.search("[Sub] Title - 01 [1080P][chs]") is None
+    assert compile_filter("CHS", "720p") is pattern
@@ -105,3 +105,13 @@ class TestGetPathBasename:
     @pytest.mark.skipif(not sys.platform.startswith("win"), reason="Windows specific")
     def test_windows_path(self):
         assert get_path_basename("C:\\path\\to\\file.txt") == "file.txt"
+
+
+def test_torrent_parser_cache():
+    file_name = "[Lilith-Raws] Boku no Kokoro no Yabai Yatsu - 01 [Baha][WEB-DL][1080p][AVC AAC][CHT][MP4].mp4"
+    bf = torrent_parser(file_name, season=2)
+    bf.title = "changed"
+    cached = torrent_parser(file_name, season=2)
+    assert cached is not bf
+    assert cached.title == "Boku no Kokoro no Yabai Yatsu"
+    assert cached.season == 2
@@ -0,0 +1,35 @@
+from module.manager import CompletionWatcher
+
+
+class FakeClient:
+    def __init__(self, responses):
+        self.responses = responses
+        self.rids = []
+
+    def get_sync_data(self, rid=0):
+        self.rids.append(rid)
+        return self.responses.pop(0)
+
+
+def test_completion_watcher():
+    client = FakeClient(
+        [
+            {
+                "rid": 1,
+                "full_update": True,
+                "torrents": {
+                    "a": {"progress": 1, "category": "Bangumi"},
+                    "b": {"progress": 0.5, "category": "Bangumi"},
+                    "c": {"progress": 0.5, "category": "Other"},
+                },
+            },
+            {"rid": 2, "torrents": {"b": {"progress": 1}, "c": {"progress": 1}}},
+            {"rid": 3, "torrents": {"b": {"progress": 1}}},
+        ]
+    )
+    watcher = CompletionWatcher(client)
+    # Torrents finished before the watcher started are left to the full scan
+    assert watcher.poll() == []
+    assert watcher.poll() == ["b"]
+    assert watcher.poll() == []
+    assert client.rids == [0, 1, 2]